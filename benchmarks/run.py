@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import httpx
+from loguru import logger
+
+from poker.api import app
+from poker.constants import Rank, Suit, Value
+from poker.models import Card, Hand, RankedHand
+from poker.parser import parse_cards, parse_hand
+from poker.rank import hands, rank_cards, rank_hand
+from poker.rank.cards import suit_of, value_of
+
+# Example hand of each rank, as posted to /rank
+HANDS = {
+    Rank.ROYAL_FLUSH: "AH KH QH JH 10H",
+    Rank.STRAIGHT_FLUSH: "6H 7H 8H 9H 10H",
+    Rank.FOUR_OF_A_KIND: "AH AC AD AS KH",
+    Rank.FULL_HOUSE: "AH AC AD KS KH",
+    Rank.FLUSH: "KC 10C 8C 7C 5C",
+    Rank.STRAIGHT: "10H 9C 8D 7S 6H",
+    Rank.THREE_OF_A_KIND: "AH AC AD KS QH",
+    Rank.TWO_PAIR: "AH AC KD KS 7H",
+    Rank.PAIR: "AH AC KD JS 7H",
+    Rank.HIGH_CARD: "AH KC QD 9S 7H",
+}
+
+Results = dict[str, dict[str, float]]
+
+
+def _time(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time a function, returning the best time per call in nanoseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"ns_per_call": best * 1e9}
+
+
+def _hand(text: str) -> Hand:
+    """Build a hand model from a hand string."""
+    return Hand(
+        cards=[
+            Card(suit=suit_of(card), value=value_of(card)) for card in parse_hand(text)
+        ]
+    )
+
+
+def bench_ranking(repeat: int) -> Results:
+    """Benchmark ranking a hand of each rank, by each implementation."""
+    results = {}
+    for rank, text in HANDS.items():
+        name = str(rank).lower().replace(" ", "_")
+        hand, cards = _hand(text), parse_hand(text)
+        results[f"rank_hand.reference.{name}"] = _time(
+            lambda: hands.rank_hand(hand), repeat
+        )
+        results[f"rank_hand.lookup.{name}"] = _time(lambda: rank_hand(hand), repeat)
+        results[f"rank_cards.{name}"] = _time(lambda: rank_cards(cards), repeat)
+    return results
+
+
+def bench_streets(repeat: int) -> Results:
+    """Benchmark ranking a player's cards again as the turn and river are dealt."""
+    from poker.rank import seven
+    from poker.rank.incremental import IncrementalHand
+
+    cards = parse_cards("AH KD 2H 3D 5S 10C KC")
+    flop = IncrementalHand(cards[:5])
+
+    def incremental() -> None:
+        hand = flop.fork()
+        hand.add(cards[5])
+        hand.add(cards[6])
+
+    def scratch() -> None:
+        seven.evaluate(cards[:6])
+        seven.evaluate(cards)
+
+    return {
+        "streets.flop": _time(lambda: IncrementalHand(cards[:5]), repeat),
+        "streets.turn_and_river.incremental": _time(incremental, repeat),
+        "streets.turn_and_river.scratch": _time(scratch, repeat),
+    }
+
+
+def bench_parsing(repeat: int) -> Results:
+    """Benchmark parsing hand strings."""
+    return {
+        f"parse_hand.{str(rank).lower().replace(' ', '_')}": _time(
+            lambda: parse_hand(text), repeat
+        )
+        for rank, text in HANDS.items()
+    }
+
+
+def bench_models(repeat: int) -> Results:
+    """Benchmark constructing and validating domain models."""
+    hand = _hand(HANDS[Rank.HIGH_CARD])
+    return {
+        "model.card": _time(lambda: Card(suit=Suit.HEARTS, value=Value.ACE), repeat),
+        "model.hand": _time(lambda: Hand(cards=hand.cards), repeat),
+        "model.ranked_hand": _time(
+            lambda: RankedHand(
+                cards=hand.cards, rank=Rank.HIGH_CARD, description="high card: ace"
+            ),
+            repeat,
+        ),
+    }
+
+
+async def _bench_http(requests: int, concurrency: int) -> dict[str, float]:
+    """Post hands to /rank through the ASGI app, measuring latency and throughput."""
+    bodies = [json.dumps(text) for text in HANDS.values()]
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+
+        async def worker(offset: int) -> None:
+            for index in range(offset, requests, concurrency):
+                start = time.perf_counter()
+                response = await client.post(
+                    "/rank",
+                    content=bodies[index % len(bodies)],
+                    headers={"content-type": "application/json"},
+                )
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests_per_second": requests / elapsed,
+        "p50_ms": percentiles[49] * 1e3,
+        "p99_ms": percentiles[98] * 1e3,
+    }
+
+
+def bench_http(requests: int, concurrency: int) -> Results:
+    """Benchmark the /rank endpoint end to end, in process."""
+    # Keep log formatting in the measurement but do not write it anywhere
+    logger.remove()
+    logger.add(lambda _: None)
+    return {"http.rank": asyncio.run(_bench_http(requests, concurrency))}
+
+
+def compare(baseline: Results, results: Results, threshold: float) -> list[str]:
+    """List benchmarks that regressed by more than a fraction of the baseline."""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            before = baseline.get(name, {}).get(metric)
+            if not before:
+                continue
+            # Throughput regresses when it falls, everything else when it rises
+            if metric.endswith("per_second"):
+                change = before - value
+            else:
+                change = value - before
+            if change / before > threshold:
+                regressions.append(f"{name} {metric}: {before:.6g} -> {value:.6g}")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run benchmarks, write results as JSON and compare them to a baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("-o", "--output", help="File to write JSON results to.")
+    parser.add_argument("--compare", help="JSON results to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fractional slowdown reported as a regression.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats.")
+    parser.add_argument("--requests", type=int, default=2000, help="HTTP requests.")
+    parser.add_argument("--concurrency", type=int, default=8, help="HTTP clients.")
+    args = parser.parse_args(argv)
+
+    results = {
+        **bench_ranking(args.repeat),
+        **bench_streets(args.repeat),
+        **bench_parsing(args.repeat),
+        **bench_models(args.repeat),
+        **bench_http(args.requests, args.concurrency),
+    }
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file)["results"], results, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
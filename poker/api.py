@@ -1,34 +1,453 @@
-from fastapi import Body, FastAPI
+import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
+
+from fastapi import Body, FastAPI, Header, HTTPException, Request, WebSocket
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from poker.constants import Suit, Value
-from poker.models import Card, Hand
-from poker.rank import rank_hand
+from poker import jobs, metrics
+from poker.batching import MicroBatcher
+from poker.constants import JobStatus, Rank, Value
+from poker.models import (
+    BestHand,
+    Equity,
+    EquityRequest,
+    Job,
+    Outs,
+    OutsRequest,
+    Readiness,
+    Showdown,
+)
+from poker.parser import format_card, parse_cards, parse_hand
+from poker.rank import distribution, engines
+from poker.rank.cache import CachedEvaluator
+from poker.rank.cards import DECK, suit_of
+from poker.rank.lookup import CLASSES, HAND_CLASSES, describe, strength
+from poker.records import MAX_LINE, rank_lines
 
+# NumPy, the seven card tables, equity and outs are imported where used, or by the
+# warm-up, so the API imports quickly
 app = FastAPI()
 
-_CARD_PATTERN = r"\s".join(5 * ["(2|3|4|5|6|7|8|9|10|J|K|Q|A)[CDHS]"])
-_SUIT_MAP = {
-    "C": Suit.CLUBS,
-    "D": Suit.DIAMONDS,
-    "H": Suit.HEARTS,
-    "S": Suit.SPADES,
-}
-_VALUE_MAP = {
-    "2": Value.TWO,
-    "3": Value.THREE,
-    "4": Value.FOUR,
-    "5": Value.FIVE,
-    "6": Value.SIX,
-    "7": Value.SEVEN,
-    "8": Value.EIGHT,
-    "9": Value.NINE,
-    "10": Value.TEN,
-    "J": Value.JACK,
-    "Q": Value.QUEEN,
-    "K": Value.KING,
-    "A": Value.ACE,
-}
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_WARM_UP: Optional["asyncio.Task[None]"] = None
+_WARM_UP_SECONDS: Optional[float] = None
+
+_METRICS = metrics.Registry()
+_REQUESTS = _METRICS.counter(
+    "poker_requests_total",
+    "HTTP requests by route, method and status.",
+    ("route", "method", "status"),
+)
+_REQUEST_SECONDS = _METRICS.histogram(
+    "poker_request_duration_seconds", "HTTP request latency by route.", ("route",)
+)
+_RANKS = _METRICS.counter(
+    "poker_ranks_total", "Hands ranked by /rank, by rank category.", ("rank",)
+)
+_STAGE_SECONDS = _METRICS.histogram(
+    "poker_rank_stage_duration_seconds", "Latency of each stage of /rank.", ("stage",)
+)
+_METRICS.callback(
+    "poker_warm_up_seconds",
+    "Time spent warming up, zero until done.",
+    "gauge",
+    lambda: _WARM_UP_SECONDS or 0.0,
+)
+
+# Hands are evaluated by the engine named by POKER_RANK_ENGINE. The table engine maps
+# a table of every hand, named by POKER_RANK_TABLE, once into the page cache to share
+# it between workers, but indexing it costs more than a table lookup in CPython, so
+# the lookup engine is the default
+_evaluate: Callable[[Sequence[int]], int] = engines.configured()
+
+# Table lookups are cheaper than canonicalising a hand, so the cache is opt in
+_CACHE_SIZE = int(os.environ.get("POKER_RANK_CACHE_SIZE", "0"))
+if _CACHE_SIZE:
+    _cache = CachedEvaluator(_evaluate, _CACHE_SIZE)
+    _evaluate = _cache
+    _METRICS.callback(
+        "poker_rank_cache_hits_total",
+        "Hands found in the /rank cache.",
+        "counter",
+        lambda: _cache.hits,
+    )
+    _METRICS.callback(
+        "poker_rank_cache_misses_total",
+        "Hands evaluated on a /rank cache miss.",
+        "counter",
+        lambda: _cache.misses,
+    )
+    _METRICS.callback(
+        "poker_rank_cache_evictions_total",
+        "Hands dropped from the /rank cache.",
+        "counter",
+        lambda: _cache.evictions,
+    )
+    _METRICS.callback(
+        "poker_rank_cache_size", "Hands in the /rank cache.", "gauge", _cache.__len__
+    )
+
+
+# Media types of rankings besides a JSON description, as a JSON object with rank id,
+# strength and description, or for batches as fixed width binary records
+RANKING_JSON = "application/vnd.poker.ranking+json"
+RANKING_BINARY = "application/vnd.poker.ranking"
+# Little endian rank id and strength of each hand of a binary batch response
+_RANKING_RECORD = "<u2"
+
+
+def _negotiate(accept: Optional[str], offers: Sequence[str]) -> str:
+    """Choose the media type of a response from those offered, by ``Accept`` header.
+
+    Clients from before rankings could be negotiated may send any ``Accept`` header,
+    so the first offer is chosen when none is acceptable, as RFC 9110 allows, rather
+    than answering 406.
+    """
+    if not accept or accept == "*/*":
+        return offers[0]
+
+    preferences = []
+    for position, item in enumerate(accept.split(",")):
+        media_type, *parameters = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            preferences.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(preferences):
+        for offer in offers:
+            if media_type in (offer, "*/*", f"{offer.partition('/')[0]}/*"):
+                return offer
+
+    return offers[0]
+
+
+# Rankings never change for a hand, so cache them for a year, the longest lifetime
+# HTTP caches are expected to honour
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _canonical(cards: Sequence[int]) -> str:
+    """Get the canonical path segment of a hand, e.g. ``AH-KH-QH-JH-10H``.
+
+    Cards are ordered from the highest value down, then by suit, and written as
+    :data:`poker.parser.CARDS` tokens, which need no escaping in a URL.
+    """
+    return "-".join(format_card(card) for card in sorted(cards, reverse=True))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check whether an ``If-None-Match`` header matches an entity tag."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _evaluate_batch(hands: Sequence[Sequence[int]]) -> list[int]:
+    """Get the hand class of each of a batch of hands with the NumPy evaluator."""
+    from poker.rank import batch
+
+    classes: list[int] = batch.evaluate(hands).tolist()
+    return classes
+
+
+# Concurrent /rank requests may be evaluated together, waiting up to a window in
+# milliseconds for a batch to fill, which is off by default
+_BATCH_WINDOW = float(os.environ.get("POKER_RANK_BATCH_WINDOW_MS", "0")) / 1000
+_BATCH_SIZE = int(os.environ.get("POKER_RANK_BATCH_SIZE", "256"))
+_BATCH_SIZES = _METRICS.histogram(
+    "poker_rank_batch_size",
+    "Hands per micro-batch of /rank requests.",
+    buckets=[2**power for power in range(11)],
+)
+_BATCHER: Optional[MicroBatcher] = None
+if _BATCH_WINDOW:
+    _BATCHER = MicroBatcher(
+        _evaluate_batch, _BATCH_WINDOW, _BATCH_SIZE, on_batch=_BATCH_SIZES.observe
+    )
+_METRICS.callback(
+    "poker_rank_queue_depth",
+    "Hands waiting for their /rank micro-batch.",
+    "gauge",
+    lambda: len(_BATCHER) if _BATCHER is not None else 0,
+)
+
+
+# Messages a WebSocket client may have awaiting results before the next is read
+_WS_MAX_IN_FLIGHT = int(os.environ.get("POKER_WS_MAX_IN_FLIGHT", "64"))
+_WS_MESSAGES = _METRICS.counter(
+    "poker_websocket_messages_total", "Messages received on /rank/ws."
+)
+
+
+async def _rank_one(hand: object) -> dict[str, str]:
+    """Rank one hand of a WebSocket message, micro-batched if configured."""
+    if not isinstance(hand, str):
+        return {"error": "Hand must be a string."}
+    try:
+        cards = parse_hand(hand)
+    except ValueError as error:
+        return {"error": str(error)}
+
+    if _BATCHER is None:
+        hand_class = _evaluate(cards)
+    else:
+        hand_class = await _BATCHER.evaluate(cards)
+    return {"description": describe(hand_class, suit_of(cards[0]))}
+
+
+def _rank_many(hands: Sequence[object]) -> list[dict[str, str]]:
+    """Rank the hands of a WebSocket message, with a description or error each."""
+    results = []
+    for hand in hands:
+        if not isinstance(hand, str):
+            results.append({"error": "Hand must be a string."})
+            continue
+        try:
+            cards = parse_hand(hand)
+        except ValueError as error:
+            results.append({"error": str(error)})
+            continue
+        results.append({"description": describe(_evaluate(cards), suit_of(cards[0]))})
+    return results
+
+
+async def _rank_message(text: str) -> dict[str, object]:
+    """Rank the hand or hands of a WebSocket message, replying with its id."""
+    try:
+        message = json.loads(text)
+    except ValueError:
+        return {"id": None, "error": "Message is not JSON."}
+    if not isinstance(message, dict):
+        return {"id": None, "error": "Message must be an object."}
+
+    reply: dict[str, object] = {"id": message.get("id")}
+    if isinstance(message.get("hands"), list):
+        reply["results"] = await run_in_threadpool(_rank_many, message["hands"])
+    elif "hand" in message:
+        reply |= await _rank_one(message["hand"])
+    else:
+        reply["error"] = "Message must have a hand or a list of hands."
+    return reply
+
+
+def _warm_up_hands() -> dict[Rank, list[int]]:
+    """Get a hand of each rank, made from the first hand class of the rank."""
+    hands: dict[Rank, list[int]] = {}
+    for hand_class in CLASSES[1:]:
+        if hand_class.rank in hands:
+            continue
+        # The deck holds each suit in turn, suited hands take a single suit and others
+        # spread their cards over suits so they are not flushes
+        values = hand_class.values
+        if hand_class.suited:
+            suits = [0] * 5
+        elif len(set(values)) == 5:
+            suits = [0, 1, 2, 3, 0]
+        else:
+            suits = [values[:index].count(value) for index, value in enumerate(values)]
+        hands[hand_class.rank] = [
+            DECK[13 * suit + value - Value.TWO] for suit, value in zip(suits, values)
+        ]
+    return hands
+
+
+@logger.catch(message="Warm-up failed, the service will not report ready.")
+def _warm_up() -> None:
+    """Build every evaluator table and rank a hand of each rank with each evaluator.
+
+    Raises:
+        RuntimeError: If the evaluators disagree on a hand.
+    """
+    global _WARM_UP_SECONDS
+    start = time.perf_counter()
+
+    # Importing these builds their tables
+    import numpy as np
+
+    from poker.rank import batch, seven
+
+    hands = _warm_up_hands()
+    classes = batch.evaluate(np.array(list(hands.values()), dtype=np.uint32))
+    for (hand_rank, cards), index in zip(hands.items(), classes.tolist()):
+        if {_evaluate(cards), seven.evaluate(cards)} != {index}:
+            raise RuntimeError(f"Evaluators disagree on a hand of rank {hand_rank}.")
+        if CLASSES[index].rank != hand_rank:
+            raise RuntimeError(
+                f"Hand of rank {hand_rank} ranked {CLASSES[index].rank}."
+            )
+        describe(index, suit_of(cards[0]))
+
+    _WARM_UP_SECONDS = time.perf_counter() - start
+    logger.info(f"Warmed up in {_WARM_UP_SECONDS:.3f}s")
+
+
+def _parse_hand(index: int, hand: str) -> list[int]:
+    """Parse a hand of a batch, raising an HTTP error on invalid input."""
+    try:
+        return parse_hand(hand)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid hand at index {index}: {error}"
+        ) from None
+
+
+class _RequestMetrics:
+    """ASGI middleware counting and timing HTTP requests by route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._routes: dict[object, str] = {}
+
+    def _route(self, scope: Scope) -> str:
+        """Get the path template of the route that handled a request."""
+        if not self._routes:
+            self._routes = {
+                getattr(route, "endpoint", None): getattr(route, "path", "")
+                for route in app.routes
+            }
+        return self._routes.get(scope.get("endpoint"), "unmatched")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Pass a request on, recording its status and duration."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            route = self._route(scope)
+            _REQUEST_SECONDS.observe(time.perf_counter() - start, route)
+            _REQUESTS.inc(route, scope["method"], str(status))
+
+
+class _RankStream:
+    """ASGI endpoint ranking newline delimited hands as they arrive.
+
+    The body is read from ``receive`` here rather than through a ``StreamingResponse``,
+    whose disconnect listener would otherwise consume the request body messages.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Stream one JSON result line back per input line."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/x-ndjson")],
+            }
+        )
+
+        buffer = b""
+        skip = False
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            more_body = message.get("more_body", False)
+
+            *lines, buffer = (buffer + message.get("body", b"")).split(b"\n")
+            if skip:
+                # Drop the remainder of a line that was too long
+                if lines:
+                    lines, skip = lines[1:], False
+                else:
+                    buffer = b""
+            if not more_body and not skip:
+                lines.append(buffer)
+
+            results = await run_in_threadpool(rank_lines, lines) if lines else b""
+            if more_body and len(buffer) > MAX_LINE:
+                results += json.dumps({"error": "Line too long."}).encode() + b"\n"
+                buffer, skip = b"", True
+
+            if results:
+                await send(
+                    {"type": "http.response.body", "body": results, "more_body": True}
+                )
+
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _executor() -> ProcessPoolExecutor:
+    """Get the process pool for sampling equity, starting it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor()
+    return _EXECUTOR
+
+
+# Bulk ranking jobs, ranked in chunks across the process pool and kept on disk so they
+# survive a restart
+_JOBS = jobs.Jobs(
+    os.environ.get("POKER_JOBS_DIR", os.path.join(tempfile.gettempdir(), "poker-jobs")),
+    int(os.environ.get("POKER_JOBS_CHUNK_SIZE", "10000")),
+    _executor,
+)
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+def _job(job_id: str) -> Job:
+    """Get a job by identifier.
+
+    Raises:
+        HTTPException: If there is no such job.
+    """
+    job = _JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@app.on_event("startup")
+async def _start_warm_up() -> None:
+    """Warm up in the background, so the health check answers in the meantime."""
+    global _WARM_UP
+    _WARM_UP = asyncio.create_task(run_in_threadpool(_warm_up))
+    _JOBS.resume()
+
+
+@app.on_event("shutdown")
+def _shutdown_executor() -> None:
+    """Stop running jobs and the process pool, if started."""
+    _JOBS.close()
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(cancel_futures=True)
 
 
 @app.get("/")
@@ -37,20 +456,405 @@ async def health_check() -> str:
     return "OK"
 
 
+@app.get("/ready")
+def ready(response: Response) -> Readiness:
+    """Readiness endpoint, unavailable until the evaluators have warmed up.
+
+    Unlike the health check, which answers as soon as the process is up, this waits
+    for every lookup table to be built and a hand of each rank to be ranked.
+    """
+    if _WARM_UP_SECONDS is None:
+        response.status_code = 503
+    return Readiness(
+        ready=_WARM_UP_SECONDS is not None, warm_up_seconds=_WARM_UP_SECONDS
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> Response:
+    """Get service metrics in the Prometheus text format."""
+    return Response(_METRICS.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.post("/rank")
-def rank(body: str = Body(regex=_CARD_PATTERN, example="2H 3D 5S 10C KD")) -> str:
+async def rank(
+    body: str = Body(example="2H 3D 5S 10C KD"),
+    accept: Optional[str] = Header(None),
+    percentile: bool = False,
+) -> Response:
     """Rank hand.
 
-    TODO: Improve error response.
+    The description is returned as a JSON string by default. Accepting
+    ``application/vnd.poker.ranking+json`` returns an object with the ``rank`` id
+    of :class:`poker.constants.Rank`, the ``strength`` of the hand, where stronger
+    hands are greater, and the ``description``.
+
+    With ``percentile=true`` the response is an object holding the ``description``
+    and the standing of the hand among all five card hands: the ``percentile`` of
+    hands it beats, the number of hands it is ``beaten_by`` and the number of other
+    hands it ``ties`` with.
+
+    Cards may also be written with ``T`` for ten, suit glyphs such as ``♥``, or in
+    lower case. Invalid hands are rejected naming the offending card.
+
+    Ranking takes microseconds so runs on the event loop. With micro-batching on,
+    the hand waits to be evaluated in a batch with those of concurrent requests.
+
+    The duration of each stage is recorded in ``poker_rank_stage_duration_seconds``,
+    where ``batch`` stands in for ``evaluate`` when micro-batching.
     """
+    media_type = _negotiate(accept, ["application/json", RANKING_JSON])
     logger.info(f"Input hand: {body}")
-    cards = [
-        Card(suit=_SUIT_MAP[card[-1]], value=_VALUE_MAP[card[:-1]])
-        for card in body.split()
+    with _STAGE_SECONDS.time("parse"):
+        try:
+            cards = parse_hand(body)
+        except ValueError as error:
+            raise HTTPException(status_code=422, detail=str(error)) from None
+
+    if _BATCHER is None:
+        with _STAGE_SECONDS.time("evaluate"):
+            hand_class = _evaluate(cards)
+    else:
+        with _STAGE_SECONDS.time("batch"):
+            hand_class = await _BATCHER.evaluate(cards)
+
+    hand_rank = CLASSES[hand_class].rank
+    _RANKS.inc(str(hand_rank))
+    logger.info(f"Hand rank: {hand_rank}")
+
+    with _STAGE_SECONDS.time("describe"):
+        description = describe(hand_class, suit_of(cards[0]))
+
+    with _STAGE_SECONDS.time("serialize"):
+        if media_type != RANKING_JSON and not percentile:
+            return JSONResponse(description)
+        content: dict[str, object] = {"description": description}
+        if media_type == RANKING_JSON:
+            content = {
+                "rank": hand_rank,
+                "strength": strength(hand_class),
+                "description": description,
+            }
+        if percentile:
+            content |= distribution.standing(hand_class)._asdict()
+        return ORJSONResponse(content, media_type=media_type)
+
+
+@app.get("/rank/{hand}")
+def get_rank(hand: str, request: Request) -> Response:
+    """Rank a hand given in the path, with responses HTTP caches may keep.
+
+    Cards are separated by ``-``, ``,`` or spaces, in any order and notation, and
+    redirect permanently to the canonical URL of the hand, e.g.
+    ``/rank/AH-KH-QH-JH-10H``, so caches hold one entry per hand.
+    """
+    try:
+        cards = parse_hand(hand.replace("-", " ").replace(",", " "))
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from None
+
+    canonical = _canonical(cards)
+    if hand != canonical:
+        return RedirectResponse(
+            request.url_for("get_rank", hand=canonical),
+            status_code=308,
+            headers={"Cache-Control": _CACHE_CONTROL},
+        )
+
+    hand_class = _evaluate(cards)
+    _RANKS.inc(str(CLASSES[hand_class].rank))
+    response = JSONResponse(describe(hand_class, suit_of(cards[0])))
+
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": _CACHE_CONTROL, "ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+@app.websocket("/rank/ws")
+async def rank_websocket(websocket: WebSocket) -> None:
+    """Rank hands sent over a WebSocket, replying to each message as it completes.
+
+    Each message is a JSON object with an ``id`` chosen by the client and either a
+    ``hand``, answered with a ``description`` or ``error``, or a list of ``hands``,
+    answered with a list of ``results`` holding one of those each. Replies echo the
+    ``id`` and may arrive out of order.
+
+    Messages are pipelined, but once ``POKER_WS_MAX_IN_FLIGHT`` await replies no more
+    are read, so clients sending faster than they are served are held back.
+    """
+    await websocket.accept()
+    in_flight = asyncio.Semaphore(_WS_MAX_IN_FLIGHT)
+    sending = asyncio.Lock()
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def reply(text: str) -> None:
+        try:
+            result = await _rank_message(text)
+            async with sending:
+                await websocket.send_json(result)
+        finally:
+            in_flight.release()
+
+    try:
+        while True:
+            await in_flight.acquire()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            text = message.get("text") or (message.get("bytes") or b"").decode(
+                "utf-8", "replace"
+            )
+            _WS_MESSAGES.inc()
+            task = asyncio.create_task(reply(text))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        # Replies to a client that has gone cannot be sent
+        for task in tasks:
+            task.cancel()
+
+
+@app.post("/rank/batch")
+def rank_batch(
+    body: Union[list[str], str] = Body(example=["2H 3D 5S 10C KD", "AH KH QH JH 10H"]),
+    accept: Optional[str] = Header(None),
+) -> Response:
+    """Rank a batch of hands.
+
+    Hands are given either as a JSON array or as newline separated text, and their
+    descriptions are returned in the same order. Accepting
+    ``application/vnd.poker.ranking+json`` returns an object per hand as for
+    ``/rank``, and accepting ``application/vnd.poker.ranking`` returns four bytes per
+    hand, its rank id and strength as little endian unsigned 16-bit integers.
+    """
+    import numpy as np
+
+    from poker.rank import batch
+
+    media_type = _negotiate(accept, ["application/json", RANKING_JSON, RANKING_BINARY])
+    hands = (
+        [hand for hand in body.splitlines() if hand] if isinstance(body, str) else body
+    )
+    logger.info(f"Input hands: {len(hands)}")
+
+    cards = np.array(
+        [_parse_hand(index, hand) for index, hand in enumerate(hands)], dtype=np.uint32
+    ).reshape(-1, 5)
+    classes = batch.evaluate(cards)
+
+    if media_type == RANKING_BINARY:
+        records = np.stack([batch.RANKS[classes], HAND_CLASSES + 1 - classes], axis=1)
+        return Response(
+            records.astype(_RANKING_RECORD).tobytes(), media_type=RANKING_BINARY
+        )
+
+    descriptions = [
+        describe(index, suit_of(first))
+        for index, first in zip(classes.tolist(), cards[:, 0].tolist())
     ]
+    if media_type == RANKING_JSON:
+        return ORJSONResponse(
+            [
+                {
+                    "rank": CLASSES[index].rank,
+                    "strength": strength(index),
+                    "description": description,
+                }
+                for index, description in zip(classes.tolist(), descriptions)
+            ],
+            media_type=RANKING_JSON,
+        )
+    return ORJSONResponse(descriptions)
+
+
+@app.post("/rank/seven")
+def rank_seven(body: str = Body(example="AH KD 2H 3D 5S 10C KC")) -> BestHand:
+    """Rank the best five card hand of two hole cards and five board cards."""
+    from poker.rank import seven
+
+    logger.info(f"Input cards: {body}")
+    try:
+        cards = parse_cards(body)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from None
+    if len(cards) != seven.MAX_CARDS:
+        raise HTTPException(status_code=422, detail="Hand must have seven cards.")
+
+    index, five = seven.best_five(cards)
+
+    return BestHand(
+        cards=[format_card(card) for card in five],
+        description=describe(index, suit_of(five[0])),
+    )
+
+
+@app.post("/showdown")
+def showdown(
+    body: list[str] = Body(example=["AH AC KD KS 7H", "AD AS KH KC 9H"]),
+) -> Showdown:
+    """Compare hands of five to seven cards, returning the indices of the winners.
+
+    Hands of more than five cards are played as their best five cards, so hold'em
+    hands can be given as hole cards followed by the board.
+    """
+    from poker.rank import seven
+
+    if len(body) < 2:
+        raise HTTPException(status_code=422, detail="Showdown needs two or more hands.")
+
+    strengths, descriptions = [], []
+    for index, hand in enumerate(body):
+        try:
+            cards = parse_cards(hand)
+        except ValueError as error:
+            raise HTTPException(
+                status_code=422, detail=f"Invalid hand at index {index}: {error}"
+            ) from None
+        if not 5 <= len(cards) <= seven.MAX_CARDS:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid hand at index {index}: Hand must have five to seven "
+                "cards.",
+            )
+
+        hand_class, five = seven.best_five(cards)
+        strengths.append(strength(hand_class))
+        descriptions.append(describe(hand_class, suit_of(five[0])))
+
+    best = max(strengths)
+    return Showdown(
+        winners=[index for index, value in enumerate(strengths) if value == best],
+        strengths=strengths,
+        descriptions=descriptions,
+    )
+
+
+@app.post("/equity")
+def calculate_equity(body: EquityRequest) -> Equity:
+    """Calculate win, tie and loss probabilities of hold'em hands.
+
+    Boards are enumerated exactly when few remain, otherwise they are sampled with the
+    given seed across a process pool and each win probability has a 95% confidence
+    interval.
+    """
+    from poker import equity
+
+    try:
+        hands = [parse_cards(hand) for hand in body.hands]
+        board, dead = parse_cards(body.board), parse_cards(body.dead)
+        executor = _executor() if body.trials > equity.CHUNK_TRIALS else None
+        return equity.calculate(
+            hands, board, dead, trials=body.trials, seed=body.seed, executor=executor
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from None
+
+
+@app.post("/outs")
+def calculate_outs(
+    body: OutsRequest = Body(example={"cards": "AH KH 7H 2H QC JD", "dead": "3H"})
+) -> Outs:
+    """Rank the hand made by each card that may be dealt next to four or six cards.
+
+    Each card improving the rank of the hand is an out, counted by the rank it
+    improves to, and the probability of improving assumes every card not known to be
+    dealt or dead is equally likely next.
+    """
+    from poker import outs
+
+    try:
+        return outs.calculate(parse_cards(body.cards), parse_cards(body.dead))
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from None
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: Request, response: Response) -> Job:
+    """Submit newline delimited hands to rank in the background.
+
+    The body is written to disk as it arrives, so it may be far larger than memory.
+    Lines are read as by ``/rank/stream``. Poll the job at the returned location.
+    """
+    # Writing to disk blocks, so it runs in the thread pool rather than the event loop
+    job_id = await run_in_threadpool(_JOBS.new)
+    lines, last = 0, b"\n"
+    with open(_JOBS.input_path(job_id), "wb") as file:
+        async for data in request.stream():
+            if data:
+                await run_in_threadpool(file.write, data)
+                lines += data.count(b"\n")
+                last = data[-1:]
+    if last != b"\n":
+        lines += 1
+
+    job = await run_in_threadpool(_JOBS.submit, job_id, lines)
+    response.headers["Location"] = request.url_for("get_job", job_id=job_id)
+    return job
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str) -> Job:
+    """Get the status and progress of a job."""
+    return _job(job_id)
+
+
+@app.get("/jobs/{job_id}/chunks/{index}")
+def get_job_chunk(job_id: str, index: int) -> Response:
+    """Get a chunk of results of a job, as soon as it is written.
+
+    Chunk ``index`` holds one JSON result line per hand of input lines
+    ``index * chunk_size`` up to ``(index + 1) * chunk_size``, skipping blank lines.
+    """
+    path = _JOBS.chunk(_job(job_id), index)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Chunk not written yet.")
+    return FileResponse(path, media_type="application/x-ndjson")
+
+
+@app.get("/jobs/{job_id}/results")
+def get_job_results(job_id: str, request: Request) -> Response:
+    """Get every result of a finished job as newline delimited JSON.
+
+    A ``Range`` header of ``bytes=start-`` or ``bytes=start-end`` resumes an
+    interrupted download.
+    """
+    job = _job(job_id)
+    if job.status != JobStatus.DONE:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.value}.")
+
+    paths = _JOBS.results(job)
+    total = sum(os.path.getsize(path) for path in paths)
+    start, stop, status = 0, total, 200
+    headers = {"Accept-Ranges": "bytes"}
+    if "range" in request.headers:
+        match = _RANGE.fullmatch(request.headers["range"].strip())
+        if (
+            match is None
+            or int(match[1]) >= total
+            or (match[2] and int(match[2]) < int(match[1]))
+        ):
+            return Response(
+                status_code=416, headers={"Content-Range": f"bytes */{total}"}
+            )
+        start, status = int(match[1]), 206
+        if match[2]:
+            stop = min(int(match[2]) + 1, total)
+        headers["Content-Range"] = f"bytes {start}-{stop - 1}/{total}"
+
+    headers["Content-Length"] = str(stop - start)
+    return StreamingResponse(
+        jobs.read(paths, start, stop),
+        status_code=status,
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
 
-    ranked_hand = rank_hand(Hand(cards=cards))
 
-    logger.info(f"Hand rank: {ranked_hand.rank}")
+# Each input line is a hand as plain text, a JSON string or a JSON object with a
+# ``hand`` field. Each output line holds either a ``description`` or an ``error``.
+app.add_route("/rank/stream", _RankStream(), methods=["POST"])
 
-    return ranked_hand.description
+app.add_middleware(_RequestMetrics)
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Callable, Sequence
+from typing import Optional
+
+_Pending = tuple[Sequence[int], "asyncio.Future[int]"]
+
+
+class MicroBatcher:
+    """Queue of hands from concurrent requests, evaluated together in batches.
+
+    A batch is evaluated once it holds ``max_size`` hands or ``window`` seconds after
+    its first hand arrived, whichever is sooner, so no hand waits longer than the
+    window for its batch to start.
+
+    Arguments:
+        evaluate: Function getting the hand class of each of a batch of hands.
+        window: Longest time in seconds to wait for a batch to fill.
+        max_size: Most hands in a batch.
+        on_batch: Function called with the size of each batch evaluated.
+
+    Attributes:
+        batches: Number of batches evaluated.
+        hands: Number of hands evaluated.
+    """
+
+    def __init__(
+        self,
+        evaluate: Callable[[Sequence[Sequence[int]]], list[int]],
+        window: float,
+        max_size: int,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        self._evaluate = evaluate
+        self.window = window
+        self.max_size = max_size
+        self._on_batch = on_batch
+        self._pending: list[_Pending] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+        self.hands = 0
+
+    async def evaluate(self, cards: Sequence[int]) -> int:
+        """Get the hand class of encoded cards, once their batch is evaluated."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[int] = loop.create_future()
+        self._pending.append((cards, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Evaluate the queued hands and resolve their futures."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        self.batches += 1
+        self.hands += len(pending)
+        if self._on_batch is not None:
+            self._on_batch(len(pending))
+
+        try:
+            classes = self._evaluate([cards for cards, _ in pending])
+        except Exception as error:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), index in zip(pending, classes):
+            # Callers may have gone, e.g. on a client disconnect
+            if not future.done():
+                future.set_result(index)
+
+    def __len__(self) -> int:
+        """Get number of hands waiting for their batch."""
+        return len(self._pending)
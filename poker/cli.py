@@ -0,0 +1,251 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+from typing import BinaryIO, Optional
+
+import uvicorn
+
+from poker.parser import format_card, parse_cards
+from poker.rank import engines, lookup, seven, shared, table
+from poker.records import rank_lines
+
+
+def _positive(text: str) -> int:
+    """Parse a positive integer argument."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"{text} is not a positive integer")
+    return value
+
+
+def _chunks(files: Sequence[BinaryIO], size: int) -> Iterator[list[bytes]]:
+    """Read lines from each file in turn, in chunks of at most ``size`` lines."""
+    for file in files:
+        while chunk := list(islice(file, size)):
+            yield chunk
+
+
+def _rank(files: Sequence[BinaryIO], output: BinaryIO, size: int, workers: int) -> None:
+    """Rank hands read from files, writing results to output in input order."""
+    if workers == 1:
+        for chunk in _chunks(files, size):
+            output.write(rank_lines(chunk))
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        # Bound the chunks in flight so memory does not grow with the input
+        pending: deque[Future[bytes]] = deque()
+        for chunk in _chunks(files, size):
+            pending.append(executor.submit(rank_lines, chunk))
+            if len(pending) >= 2 * workers:
+                output.write(pending.popleft().result())
+        while pending:
+            output.write(pending.popleft().result())
+
+
+def _table(path: str) -> None:
+    """Build the table of every five card hand and write it to a file.
+
+    The table is written to a temporary file and moved into place, so processes
+    mapping an existing table are not affected.
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        table.write(file, table.build())
+    os.replace(temporary, path)
+
+
+def _serve(host: str, port: int, workers: int) -> None:
+    """Run the API, building lookup tables once for all worker processes to map."""
+    # Prefer shared memory where there is a file system for it
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.NamedTemporaryFile(prefix="poker-", dir=directory) as file:
+        shared.write(file, *lookup.tables(), *seven.tables())
+        file.flush()
+        os.environ[shared.ENVIRONMENT] = file.name
+        uvicorn.run("poker.api:app", host=host, port=port, workers=workers)
+
+
+def _verify(name: str, hands: int, size: int, workers: int) -> int:
+    """Compare an engine with the reference over the first hands of every hand.
+
+    Returns:
+        Number of hands the engine ranks differently from the reference.
+    """
+    slices = [(start, min(start + size, hands)) for start in range(0, hands, size)]
+    seconds, mismatches = 0.0, []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(engines.compare, name, *bounds) for bounds in slices]
+        for future in futures:
+            engine_seconds, found = future.result()
+            seconds += engine_seconds
+            mismatches += found
+
+    for mismatch in mismatches[:10]:
+        cards = " ".join(format_card(card) for card in mismatch.cards)
+        print(f"{cards}: expected {mismatch.expected}, got {mismatch.actual}")
+    print(
+        f"{name}: {hands} hands, {len(mismatches)} mismatches, "
+        f"{hands / seconds:,.0f} hands/s per process, "
+        f"{time.perf_counter() - start:.1f}s in all"
+    )
+    return len(mismatches)
+
+
+def _simulate(
+    deals: int, players: int, cards: int, dead: Sequence[int], seed: Optional[int]
+) -> None:
+    """Deal random hands, printing the frequency of each rank as JSON."""
+    from poker.simulation import simulate
+
+    start = time.perf_counter()
+    result = simulate(deals, players, cards, dead, seed)
+    seconds = time.perf_counter() - start
+    report = {
+        "seed": result.seed,
+        "hands": result.hands,
+        "hands_per_second": round(result.hands / seconds),
+        "frequencies": {str(rank): count for rank, count in result.frequencies.items()},
+    }
+    print(json.dumps(report, indent=2))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run command line interface."""
+    parser = argparse.ArgumentParser(prog="python -m poker.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rank = commands.add_parser(
+        "rank",
+        help="Rank hands from files of plain text or JSON lines.",
+        description="Rank hands, writing one JSON result per line in input order.",
+    )
+    rank.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="Files to read hands from, one per line, or - for stdin.",
+    )
+    rank.add_argument(
+        "-o", "--output", default="-", help="File to write results to, or - for stdout."
+    )
+    rank.add_argument(
+        "--chunk-size", type=_positive, default=10_000, help="Lines per unit of work."
+    )
+    rank.add_argument(
+        "--workers",
+        type=_positive,
+        default=os.cpu_count() or 1,
+        help="Worker processes, defaults to the number of cores.",
+    )
+
+    table_command = commands.add_parser(
+        "table",
+        help="Build the memory-mapped table of every five card hand.",
+        description="Build the table of every five card hand for POKER_RANK_TABLE.",
+    )
+    table_command.add_argument("-o", "--output", required=True, help="File to write.")
+
+    serve = commands.add_parser(
+        "serve",
+        help="Run the API with lookup tables shared between worker processes.",
+        description="Run the API, building lookup tables once and mapping them into "
+        "every worker process.",
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="Address to bind.")
+    serve.add_argument("--port", type=int, default=8000, help="Port to bind.")
+    serve.add_argument("--workers", type=_positive, default=1, help="Worker processes.")
+
+    verify = commands.add_parser(
+        "verify",
+        help="Check an evaluator engine against the reference over every hand.",
+        description="Rank every five card hand with an engine and with the rule "
+        "based reference, reporting mismatches and the throughput of the engine.",
+    )
+    verify.add_argument("engine", choices=sorted(engines.ENGINES), help="Engine.")
+    verify.add_argument(
+        "--hands",
+        type=_positive,
+        default=table.HANDS,
+        help="Check only the first hands, defaults to all of them.",
+    )
+    verify.add_argument(
+        "--chunk-size", type=_positive, default=10_000, help="Hands per unit of work."
+    )
+    verify.add_argument(
+        "--workers",
+        type=_positive,
+        default=os.cpu_count() or 1,
+        help="Worker processes, defaults to the number of cores.",
+    )
+
+    simulate = commands.add_parser(
+        "simulate",
+        help="Count the ranks of random deals.",
+        description="Deal random hands with NumPy and count the hands of each rank.",
+    )
+    simulate.add_argument(
+        "--deals", type=_positive, default=1_000_000, help="Number of deals."
+    )
+    simulate.add_argument(
+        "--players", type=_positive, default=1, help="Hands per deal."
+    )
+    simulate.add_argument(
+        "--cards", type=int, choices=[5, 6, 7], default=5, help="Cards per hand."
+    )
+    simulate.add_argument(
+        "--dead", default="", help="Cards out of the deck, e.g. 'AH KD'."
+    )
+    simulate.add_argument("--seed", type=int, help="Seed to reproduce deals.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "table":
+        _table(args.output)
+        return
+    if args.command == "serve":
+        _serve(args.host, args.port, args.workers)
+        return
+    if args.command == "simulate":
+        try:
+            _simulate(
+                args.deals, args.players, args.cards, parse_cards(args.dead), args.seed
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        return
+    if args.command == "verify":
+        try:
+            mismatches = _verify(
+                args.engine, min(args.hands, table.HANDS), args.chunk_size, args.workers
+            )
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        if mismatches:
+            sys.exit(1)
+        return
+
+    with ExitStack() as stack:
+        files = [
+            sys.stdin.buffer if name == "-" else stack.enter_context(open(name, "rb"))
+            for name in args.files
+        ]
+        output = (
+            sys.stdout.buffer
+            if args.output == "-"
+            else stack.enter_context(open(args.output, "wb"))
+        )
+        _rank(files, output, args.chunk_size, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -56,3 +56,12 @@ class Value(IntEnum):
         else:
             out = str(self.value)
         return out
+
+
+class JobStatus(AutoName):
+    """Bulk ranking job status enum."""
+
+    QUEUED = auto()
+    RUNNING = auto()
+    DONE = auto()
+    FAILED = auto()
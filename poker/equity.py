@@ -0,0 +1,135 @@
+import random
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from itertools import combinations
+from math import comb, sqrt
+from typing import Optional
+
+from poker.models import Equity, PlayerEquity
+from poker.rank.cards import DECK
+from poker.rank.seven import evaluate
+
+# Boards are enumerated when there are at most this many, sampled otherwise.
+EXACT_LIMIT = 50_000
+# Sampled boards per unit of work, fixed so results do not depend on the executor.
+CHUNK_TRIALS = 10_000
+
+_Z = 1.96
+_Tally = tuple[list[int], list[int]]
+
+
+def _tally(
+    hands: Sequence[Sequence[int]],
+    board: Sequence[int],
+    boards: Sequence[Sequence[int]],
+) -> _Tally:
+    """Count the boards each hand wins outright and ties."""
+    wins = [0] * len(hands)
+    ties = [0] * len(hands)
+    for extra in boards:
+        full = [*board, *extra]
+        classes = [evaluate([*hand, *full]) for hand in hands]
+        best = min(classes)
+        winners = [index for index, value in enumerate(classes) if value == best]
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+        else:
+            for index in winners:
+                ties[index] += 1
+    return wins, ties
+
+
+def _sample(
+    hands: Sequence[Sequence[int]],
+    board: Sequence[int],
+    deck: Sequence[int],
+    trials: int,
+    seed: str,
+) -> _Tally:
+    """Count wins and ties over randomly sampled boards."""
+    rng = random.Random(seed)
+    missing = 5 - len(board)
+    return _tally(hands, board, [rng.sample(deck, missing) for _ in range(trials)])
+
+
+def _validate(
+    hands: Sequence[Sequence[int]], board: Sequence[int], dead: Sequence[int]
+) -> None:
+    """Validate hands, board and dead cards."""
+    if len(hands) < 2:
+        raise ValueError("Equity needs two or more hands.")
+    if any(not 1 <= len(hand) <= 2 for hand in hands):
+        raise ValueError("Hands must have one or two cards.")
+    if len(board) > 5:
+        raise ValueError("Board must have at most five cards.")
+
+    cards = [*(card for hand in hands for card in hand), *board, *dead]
+    if len(set(cards)) != len(cards):
+        raise ValueError("Cards must not be repeated.")
+    if len(DECK) - len(cards) < 5 - len(board):
+        raise ValueError("Not enough cards left to complete the board.")
+
+
+def calculate(
+    hands: Sequence[Sequence[int]],
+    board: Sequence[int] = (),
+    dead: Sequence[int] = (),
+    trials: int = 100_000,
+    seed: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Equity:
+    """Calculate the equity of hands against each other.
+
+    Each hand is played as its best five cards from its own cards and the board, as
+    in Texas hold'em. Every way of completing the board is enumerated if there are at
+    most :data:`EXACT_LIMIT`, otherwise ``trials`` boards are sampled.
+
+    Arguments:
+        hands: Encoded hole cards of each player, one or two each.
+        board: Encoded board cards dealt so far.
+        dead: Encoded cards known to be out of the deck.
+        trials: Number of boards to sample if not enumerating.
+        seed: Seed for sampling, random if not given.
+        executor: Executor to spread sampling across, e.g. a process pool.
+
+    Raises:
+        ValueError: If the cards do not make a valid deal.
+    """
+    _validate(hands, board, dead)
+
+    used = {*(card for hand in hands for card in hand), *board, *dead}
+    deck = [card for card in DECK if card not in used]
+    missing = 5 - len(board)
+
+    exact = comb(len(deck), missing) <= EXACT_LIMIT
+    if exact:
+        boards = list(combinations(deck, missing))
+        wins, ties = _tally(hands, board, boards)
+        trials = len(boards)
+        seed = None
+    else:
+        if seed is None:
+            seed = random.getrandbits(32)
+        chunks = [
+            (hands, board, deck, min(CHUNK_TRIALS, trials - start), f"{seed}:{start}")
+            for start in range(0, trials, CHUNK_TRIALS)
+        ]
+        if executor is None or len(chunks) == 1:
+            results = [_sample(*chunk) for chunk in chunks]
+        else:
+            results = list(executor.map(_sample, *zip(*chunks)))
+        wins = [sum(counts) for counts in zip(*(result[0] for result in results))]
+        ties = [sum(counts) for counts in zip(*(result[1] for result in results))]
+
+    players = []
+    for win_count, tie_count in zip(wins, ties):
+        win, tie = win_count / trials, tie_count / trials
+        interval = None
+        if not exact:
+            margin = _Z * sqrt(win * (1 - win) / trials)
+            interval = (max(0.0, win - margin), min(1.0, win + margin))
+        players.append(
+            PlayerEquity(win=win, tie=tie, loss=1 - win - tie, interval=interval)
+        )
+
+    return Equity(exact=exact, trials=trials, seed=seed, players=players)
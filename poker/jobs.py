@@ -0,0 +1,224 @@
+import fcntl
+import os
+import re
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from itertools import islice
+from threading import Event
+from typing import BinaryIO, Optional
+
+from loguru import logger
+
+from poker.constants import JobStatus
+from poker.models import Job
+from poker.records import rank_lines
+
+# Chunks of a job being ranked at once, bounding the memory a job takes.
+MAX_PENDING = 8
+
+_ID = re.compile(r"[0-9a-f]{32}")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file so it either holds all of the data or does not exist."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+
+
+class Jobs:
+    """Bulk ranking jobs kept in a directory and run one at a time in the background.
+
+    Each job has a directory holding its input, its state and a file of results per
+    chunk of input lines. Chunks are written whole, so a job that stops part way,
+    e.g. when the service restarts, resumes from its last completed chunk.
+
+    Arguments:
+        directory: Directory to keep jobs in.
+        chunk_size: Lines of input per chunk of results.
+        executor: Function getting the executor to rank chunks in, e.g. a process
+            pool, or None to rank them in the background thread.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        chunk_size: int,
+        executor: Callable[[], Optional[Executor]],
+    ) -> None:
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self._executor = executor
+        self._runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jobs")
+        self._stopping = Event()
+
+    def _path(self, job_id: str, *parts: str) -> str:
+        """Get the path of a file of a job."""
+        return os.path.join(self.directory, job_id, *parts)
+
+    def _chunk_path(self, job_id: str, index: int) -> str:
+        """Get the path of a chunk of results."""
+        return self._path(job_id, "chunks", f"{index:08d}.jsonl")
+
+    def _save(self, job: Job) -> None:
+        """Save the state of a job."""
+        _write_atomic(self._path(job.job_id, "job.json"), job.json().encode())
+
+    def new(self) -> str:
+        """Create the directory of a new job, returning its identifier."""
+        job_id = uuid.uuid4().hex
+        os.makedirs(self._path(job_id, "chunks"))
+        return job_id
+
+    def input_path(self, job_id: str) -> str:
+        """Get the path to write the input of a new job to."""
+        return self._path(job_id, "input")
+
+    def submit(self, job_id: str, lines: int) -> Job:
+        """Queue a new job to run once its input is written.
+
+        Arguments:
+            job_id: Identifier from :meth:`new`.
+            lines: Number of lines of input.
+        """
+        job = Job(
+            job_id=job_id,
+            status=JobStatus.QUEUED,
+            lines=lines,
+            chunk_size=self.chunk_size,
+            chunks=-(-lines // self.chunk_size),
+        )
+        self._save(job)
+        self._runner.submit(self._run, job_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job with its progress, or None if there is no such job."""
+        if not _ID.fullmatch(job_id):
+            return None
+        try:
+            job = Job.parse_file(self._path(job_id, "job.json"))
+        except FileNotFoundError:
+            return None
+
+        job.completed_chunks = sum(
+            1
+            for name in os.listdir(self._path(job_id, "chunks"))
+            if name.endswith(".jsonl")
+        )
+        return job
+
+    def chunk(self, job: Job, index: int) -> Optional[str]:
+        """Get the path of a chunk of results, or None if it is not written yet."""
+        path = self._chunk_path(job.job_id, index)
+        return path if 0 <= index < job.chunks and os.path.exists(path) else None
+
+    def results(self, job: Job) -> list[str]:
+        """Get the paths of every chunk of results of a finished job, in order."""
+        return [self._chunk_path(job.job_id, index) for index in range(job.chunks)]
+
+    def resume(self) -> None:
+        """Queue every job that has not finished, e.g. after a restart."""
+        if not os.path.isdir(self.directory):
+            return
+        for job_id in sorted(os.listdir(self.directory)):
+            job = self.get(job_id)
+            if job is not None and job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+                logger.info(f"Resuming job {job_id} from chunk {job.completed_chunks}")
+                self._runner.submit(self._run, job_id)
+
+    def _run(self, job_id: str) -> None:
+        """Rank the chunks of a job that are not written yet, unless another has.
+
+        API worker processes share the directory and each resumes every unfinished
+        job, so a job is claimed by locking its lock file while it runs. The lock is
+        released when the file is closed, including when the process dies.
+        """
+        with open(self._path(job_id, "lock"), "wb") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.info(f"Job {job_id} is running in another process")
+                return
+            self._run_claimed(job_id)
+
+    def _run_claimed(self, job_id: str) -> None:
+        """Rank the chunks of a job that are not written yet, once it is claimed."""
+        job = Job.parse_file(self._path(job_id, "job.json"))
+        if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+            # Another process finished the job before it was claimed here
+            return
+        job.status = JobStatus.RUNNING
+        self._save(job)
+
+        try:
+            with open(self._path(job_id, "input"), "rb") as file:
+                self._rank(job, file)
+        except Exception as error:
+            if self._stopping.is_set():
+                # Chunks in flight were cancelled, the job resumes on restart
+                return
+            logger.exception(f"Job {job_id} failed")
+            job.status, job.error = JobStatus.FAILED, str(error)
+        else:
+            if self._stopping.is_set():
+                return
+            job.status = JobStatus.DONE
+        self._save(job)
+
+    def _rank(self, job: Job, file: BinaryIO) -> None:
+        """Rank the chunks of input not written yet, writing each as it completes."""
+        executor = self._executor()
+        pending: deque[tuple[int, Future[bytes]]] = deque()
+
+        def write_next() -> None:
+            index, future = pending.popleft()
+            _write_atomic(self._chunk_path(job.job_id, index), future.result())
+
+        for index, chunk in enumerate(_chunks(file, job.chunk_size)):
+            if self._stopping.is_set():
+                return
+            if os.path.exists(self._chunk_path(job.job_id, index)):
+                continue
+            if executor is None:
+                _write_atomic(self._chunk_path(job.job_id, index), rank_lines(chunk))
+                continue
+            pending.append((index, executor.submit(rank_lines, chunk)))
+            if len(pending) >= MAX_PENDING:
+                write_next()
+        while pending:
+            write_next()
+
+    def close(self) -> None:
+        """Stop running jobs after the chunks in flight, leaving them to resume."""
+        self._stopping.set()
+        self._runner.shutdown(wait=False, cancel_futures=True)
+
+
+def read(paths: Sequence[str], start: int, stop: int) -> Iterator[bytes]:
+    """Read a range of bytes from files taken one after another.
+
+    Arguments:
+        paths: Files to read, e.g. the chunks of results of a job.
+        start: Offset of the first byte to read.
+        stop: Offset after the last byte to read.
+    """
+    for path in paths:
+        size = os.path.getsize(path)
+        if start < size and stop > 0:
+            with open(path, "rb") as file:
+                file.seek(start)
+                remaining = min(stop, size) - max(start, 0)
+                while remaining > 0 and (data := file.read(min(remaining, 1 << 16))):
+                    remaining -= len(data)
+                    yield data
+        start, stop = max(start - size, 0), stop - size
+
+
+def _chunks(file: BinaryIO, size: int) -> Iterator[list[bytes]]:
+    """Read lines from a file in chunks of ``size`` lines."""
+    while chunk := list(islice(file, size)):
+        yield chunk
@@ -0,0 +1,247 @@
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from threading import Lock
+from typing import Union
+
+# Content type of the Prometheus text exposition format.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds, from a table lookup to a slow request.
+LATENCY_BUCKETS = (
+    0.000001,
+    0.0000025,
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label names and values, e.g. ``{stage="parse"}``."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    """Metric with a name, help text and label names."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = Lock()
+
+    def _check(self, values: Sequence[str]) -> None:
+        """Check that a value is given for each label."""
+        if len(values) != len(self.labels):
+            raise ValueError(
+                f"Metric {self.name} takes labels {self.labels}, got {len(values)}."
+            )
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Get lines of samples."""
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Count of events, optionally by label."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str]) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple[str, ...], Union[int, float]] = {}
+
+    def inc(self, *values: str, amount: Union[int, float] = 1) -> None:
+        """Increment the count of the given label values."""
+        self._check(values)
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def get(self, *values: str) -> Union[int, float]:
+        """Get the count of the given label values."""
+        return self._values.get(values, 0)
+
+    def samples(self) -> Iterator[str]:
+        """Get a line per label values."""
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_labels(self.labels, labels)} {_number(value)}"
+
+
+class Callback(_Metric):
+    """Metric read from a function when collected, e.g. the size of a queue."""
+
+    def __init__(
+        self, name: str, documentation: str, kind: str, collect: Callable[[], float]
+    ) -> None:
+        super().__init__(name, documentation, ())
+        self.kind = kind
+        self._collect = collect
+
+    def samples(self) -> Iterator[str]:
+        """Get a line with the current value."""
+        yield f"{self.name} {_number(self._collect())}"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, optionally by label."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = (*sorted(buckets), float("inf"))
+        # Count per bucket, not cumulative, then the sum of observed values
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *values: str) -> None:
+        """Record a value for the given label values."""
+        self._check(values)
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                values, ([0] * len(self.buckets), [0.0])
+            )
+            counts[bucket] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, *values: str) -> Iterator[None]:
+        """Record the duration of a block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *values)
+
+    def count(self, *values: str) -> int:
+        """Get the number of values recorded for the given label values."""
+        if values not in self._values:
+            return 0
+        return sum(self._values[values][0])
+
+    def samples(self) -> Iterator[str]:
+        """Get cumulative bucket, sum and count lines per label values."""
+        with self._lock:
+            values = sorted(
+                (labels, (list(counts), total[0]))
+                for labels, (counts, total) in self._values.items()
+            )
+        for labels, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket = _labels((*self.labels, "le"), (*labels, _number(bound)))
+                yield f"{self.name}_bucket{bucket} {cumulative}"
+            suffix = _labels(self.labels, labels)
+            yield f"{self.name}_sum{suffix} {_number(total)}"
+            yield f"{self.name}_count{suffix} {cumulative}"
+
+
+class Registry:
+    """Collection of metrics rendered together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> None:
+        """Add a metric, checking its name is unique."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        counter = Counter(name, documentation, labels)
+        self._register(counter)
+        return counter
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        collect: Callable[[], float],
+    ) -> Callback:
+        """Create and register a counter or gauge read from a function when collected.
+
+        Arguments:
+            name: Metric name.
+            documentation: Help text.
+            kind: Prometheus metric type, e.g. ``counter`` or ``gauge``.
+            collect: Function returning the current value.
+        """
+        callback = Callback(name, documentation, kind, collect)
+        self._register(callback)
+        return callback
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        histogram = Histogram(name, documentation, labels, buckets)
+        self._register(histogram)
+        return histogram
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        return "".join(metric.render() for metric in self._metrics.values())
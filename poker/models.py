@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from collections import Counter
+from typing import Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 
-from poker.constants import Rank, Suit, Value
+from poker.constants import JobStatus, Rank, Suit, Value
+
+# Most boards an equity request may sample, so one request cannot occupy the process
+# pool for long.
+MAX_TRIALS = 1_000_000
 
 
 class Card(BaseModel):
@@ -15,7 +20,7 @@ class Card(BaseModel):
 
     def __hash__(self) -> int:
         """Hash function."""
-        return hash(f"{self.value} {self.suit}")
+        return hash((self.suit, self.value))
 
     def __le__(self, other: Card) -> bool:
         """Less than or equal to."""
@@ -56,3 +61,145 @@ class RankedHand(Hand):
 
     rank: Rank
     description: str
+
+
+class BestHand(BaseModel):
+    """Best five card hand domain model class."""
+
+    cards: list[str]
+    description: str
+
+
+class Showdown(BaseModel):
+    """Showdown result domain model class."""
+
+    winners: list[int]
+    strengths: list[int]
+    descriptions: list[str]
+
+
+class EquityRequest(BaseModel):
+    """Equity request domain model class."""
+
+    hands: list[str]
+    board: str = ""
+    dead: str = ""
+    trials: int = Field(default=100_000, gt=0, le=MAX_TRIALS)
+    seed: Optional[int] = None
+
+
+class PlayerEquity(BaseModel):
+    """Player equity domain model class."""
+
+    win: float
+    tie: float
+    loss: float
+    interval: Optional[tuple[float, float]] = None
+
+
+class Equity(BaseModel):
+    """Equity domain model class.
+
+    Attributes:
+        exact: Whether every remaining board was enumerated, otherwise boards were
+            sampled and each player has a 95% confidence interval on winning.
+        trials: Number of boards enumerated or sampled.
+        seed: Seed of sampled boards, to reproduce them.
+        players: Equity of each player, in the order given.
+    """
+
+    exact: bool
+    trials: int
+    seed: Optional[int] = None
+    players: list[PlayerEquity]
+
+
+class OutsRequest(BaseModel):
+    """Outs request domain model class."""
+
+    cards: str
+    dead: str = ""
+
+
+class NextCard(BaseModel):
+    """Next card domain model class.
+
+    Attributes:
+        card: Card that may be dealt next.
+        rank: Rank of the best hand with the card.
+        description: Description of the best hand with the card.
+        improves: Whether the card improves the rank of the hand.
+    """
+
+    card: str
+    rank: Rank
+    description: str
+    improves: bool
+
+
+class RankOuts(BaseModel):
+    """Outs to a rank domain model class.
+
+    Attributes:
+        rank: Rank improved to.
+        outs: Number of next cards improving the hand to the rank.
+        probability: Probability of the next card improving the hand to the rank.
+    """
+
+    rank: Rank
+    outs: int
+    probability: float
+
+
+class Outs(BaseModel):
+    """Outs domain model class.
+
+    Attributes:
+        rank: Rank of the best hand of the known cards.
+        description: Description of the best hand of the known cards.
+        cards: Every card that may be dealt next, with the hand it makes.
+        ranks: Outs to each rank better than the current rank, best rank first.
+        outs: Number of next cards improving the rank of the hand.
+        probability: Probability of the next card improving the rank of the hand.
+    """
+
+    rank: Rank
+    description: str
+    cards: list[NextCard]
+    ranks: list[RankOuts]
+    outs: int
+    probability: float
+
+
+class Readiness(BaseModel):
+    """Readiness domain model class.
+
+    Attributes:
+        ready: Whether the service has finished warming up.
+        warm_up_seconds: Time spent loading tables and ranking the warm-up batch.
+    """
+
+    ready: bool
+    warm_up_seconds: Optional[float] = None
+
+
+class Job(BaseModel):
+    """Bulk ranking job domain model class.
+
+    Attributes:
+        job_id: Job identifier.
+        status: Job status.
+        lines: Number of lines of input.
+        chunk_size: Lines of input per chunk of results.
+        chunks: Number of chunks of results the job writes.
+        completed_chunks: Number of chunks of results written so far.
+        error: Why the job failed, if it did.
+    """
+
+    job_id: str
+    status: JobStatus
+    lines: int
+    chunk_size: int
+    chunks: int
+    completed_chunks: int = 0
+    error: Optional[str] = None
@@ -0,0 +1,73 @@
+from collections.abc import Sequence
+
+from poker.constants import Rank
+from poker.models import NextCard, Outs, RankOuts
+from poker.parser import format_card
+from poker.rank.cards import DECK
+from poker.rank.incremental import IncrementalHand
+
+# Known cards outs are counted for, e.g. a flop or a turn and two hole cards.
+KNOWN_CARDS = (4, 6)
+
+
+def calculate(cards: Sequence[int], dead: Sequence[int] = ()) -> Outs:
+    """Rank the hand made by every card that may be dealt next.
+
+    The known cards are evaluated once and each next card is added to a fork of them,
+    so no hand is evaluated from scratch. A card is an out if it improves the rank of
+    the hand, not merely its kickers.
+
+    Arguments:
+        cards: Four or six known cards encoded with :func:`poker.rank.cards.encode`.
+        dead: Cards known not to be dealt next, e.g. folded cards.
+
+    Raises:
+        ValueError: If there are not four or six known cards, a card is repeated or
+            no card may be dealt next.
+    """
+    if len(cards) not in KNOWN_CARDS:
+        raise ValueError("Hand must have four or six cards.")
+    seen = [*cards, *dead]
+    if len(set(seen)) != len(seen):
+        raise ValueError("Cards must not be repeated.")
+    if len(seen) == len(DECK):
+        raise ValueError("No cards left to deal.")
+
+    hand = IncrementalHand(cards)
+    rank, description = hand.ranked()
+
+    unseen = set(DECK).difference(seen)
+    next_cards = []
+    counts = dict.fromkeys(Rank, 0)
+    for card in DECK:
+        if card not in unseen:
+            continue
+        branch = hand.fork()
+        branch.add(card)
+        next_rank, next_description = branch.ranked()
+        counts[next_rank] += 1
+        # Fields are known to be valid, so skip validating each of the models
+        next_cards.append(
+            NextCard.construct(
+                card=format_card(card),
+                rank=next_rank,
+                description=next_description,
+                improves=next_rank < rank,
+            )
+        )
+
+    total = len(next_cards)
+    ranks = [
+        RankOuts(rank=better, outs=outs, probability=outs / total)
+        for better, outs in counts.items()
+        if better < rank and outs
+    ]
+    outs = sum(rank_outs.outs for rank_outs in ranks)
+    return Outs(
+        rank=rank,
+        description=description,
+        cards=next_cards,
+        ranks=ranks,
+        outs=outs,
+        probability=outs / total,
+    )
@@ -0,0 +1,136 @@
+import json
+
+from poker.constants import Suit, Value
+from poker.rank.cards import encode
+
+_SUIT_MAP = {
+    "C": Suit.CLUBS,
+    "D": Suit.DIAMONDS,
+    "H": Suit.HEARTS,
+    "S": Suit.SPADES,
+}
+_VALUE_MAP = {
+    "2": Value.TWO,
+    "3": Value.THREE,
+    "4": Value.FOUR,
+    "5": Value.FIVE,
+    "6": Value.SIX,
+    "7": Value.SEVEN,
+    "8": Value.EIGHT,
+    "9": Value.NINE,
+    "10": Value.TEN,
+    "J": Value.JACK,
+    "Q": Value.QUEEN,
+    "K": Value.KING,
+    "A": Value.ACE,
+}
+CARDS = {
+    f"{value}{suit}": encode(_SUIT_MAP[suit], _VALUE_MAP[value])
+    for suit in _SUIT_MAP
+    for value in _VALUE_MAP
+}
+_TOKENS = {card: token for token, card in CARDS.items()}
+
+# Alternative spellings of values and suits, accepted in either case.
+_VALUE_ALIASES = {"T": "10"}
+_SUIT_ALIASES = {
+    "♣": "C",
+    "♧": "C",
+    "♦": "D",
+    "♢": "D",
+    "♥": "H",
+    "♡": "H",
+    "♠": "S",
+    "♤": "S",
+}
+
+
+def _notations() -> dict[str, int]:
+    """Map every accepted spelling of every card to its encoding."""
+    values = {value: value for value in _VALUE_MAP} | _VALUE_ALIASES
+    suits = {suit: suit for suit in _SUIT_MAP} | _SUIT_ALIASES
+    notations = {}
+    for value, canonical_value in values.items():
+        for suit, canonical_suit in suits.items():
+            card = CARDS[f"{canonical_value}{canonical_suit}"]
+            for value_case in {value, value.lower()}:
+                for suit_case in {suit, suit.lower()}:
+                    notations[f"{value_case}{suit_case}"] = card
+    return notations
+
+
+# Parsing is one dictionary lookup per whitespace separated token
+_NOTATIONS = _notations()
+
+
+def parse_cards(text: str) -> list[int]:
+    """Parse any number of unique cards, e.g. ``"2H 3D"``.
+
+    Besides the canonical tokens of :data:`CARDS`, ten may be written ``T``, suits
+    may be written as glyphs such as ``♥``, and either may be lower case, e.g.
+    ``"Th 9♠ ac"``.
+
+    Arguments:
+        text: Whitespace separated cards.
+
+    Returns:
+        Cards encoded with :func:`poker.rank.cards.encode`.
+
+    Raises:
+        ValueError: If the text holds an invalid or duplicate card, naming the card.
+    """
+    tokens = text.split()
+    try:
+        cards = [_NOTATIONS[token] for token in tokens]
+    except KeyError as error:
+        raise ValueError(f"Invalid card: {error.args[0]!r}.") from None
+
+    if len(set(cards)) != len(cards):
+        seen = set()
+        for token, card in zip(tokens, cards):
+            if card in seen:
+                raise ValueError(f"Hand contains duplicate card: {token!r}.")
+            seen.add(card)
+
+    return cards
+
+
+def parse_hand(text: str) -> list[int]:
+    """Parse a hand of five unique cards, e.g. ``"2H 3D 5S 10C KD"``.
+
+    Raises:
+        ValueError: If the text is not five unique cards.
+    """
+    cards = parse_cards(text)
+    if len(cards) != 5:
+        raise ValueError("Hand must have five cards.")
+
+    return cards
+
+
+def format_card(card: int) -> str:
+    """Format an encoded card as a token, e.g. ``"10C"``."""
+    return _TOKENS[card]
+
+
+def read_hand(line: str) -> str:
+    """Read a hand from a line of plain text or JSON lines input.
+
+    Lines starting with a quote, brace or bracket are decoded as JSON, and must hold
+    either a string or an object with a ``hand`` field. Any other line is taken to be
+    the hand itself.
+
+    Raises:
+        ValueError: If a JSON line is malformed or has no hand.
+    """
+    line = line.strip()
+    if not line.startswith(('"', "{", "[")):
+        return line
+
+    record = json.loads(line)
+    if isinstance(record, dict):
+        record = record.get("hand")
+    if not isinstance(record, str):
+        raise ValueError("Record has no hand.")
+
+    return record
@@ -1,3 +1,3 @@
-from poker.rank.hands import rank_hand
+from poker.rank.lookup import rank_cards, rank_hand
 
-__all__ = ["rank_hand"]
+__all__ = ["rank_cards", "rank_hand"]
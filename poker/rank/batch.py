@@ -0,0 +1,106 @@
+import numpy as np
+import numpy.typing as npt
+
+from poker.rank import lookup, seven
+from poker.rank.lookup import CLASSES
+from poker.rank.seven import MAX_CARDS
+
+_FLUSHES, _UNIQUE5, _PRODUCTS = lookup.tables()
+_FLUSH_BEST, _PRODUCT_BEST = seven.tables()
+
+_FLUSH_TABLE = np.array(_FLUSHES, dtype=np.uint16)
+_UNIQUE5_TABLE = np.array(_UNIQUE5, dtype=np.uint16)
+_PRODUCT_KEYS = np.array(sorted(_PRODUCTS), dtype=np.uint32)
+_PRODUCT_CLASSES = np.array([_PRODUCTS[key] for key in sorted(_PRODUCTS)], np.uint16)
+
+_FLUSH_BEST_TABLE = np.array(_FLUSH_BEST, dtype=np.uint16)
+_BEST_KEYS = np.array(sorted(_PRODUCT_BEST), dtype=np.uint64)
+_BEST_CLASSES = np.array([_PRODUCT_BEST[key] for key in _BEST_KEYS.tolist()], np.uint16)
+
+# Rank id of each hand class, to index with an array of hand classes.
+RANKS = np.array([hand_class.rank for hand_class in CLASSES], dtype=np.uint16)
+
+
+def evaluate(cards: npt.ArrayLike) -> npt.NDArray[np.uint16]:
+    """Get the hand classes of a batch of five card hands.
+
+    This is the vectorised counterpart of :func:`poker.rank.lookup.evaluate`, prime
+    products are resolved by binary search over the sorted product keys.
+
+    Arguments:
+        cards: Array of shape ``(N, 5)`` holding cards encoded with
+            :func:`poker.rank.cards.encode`.
+
+    Returns:
+        Array of shape ``(N,)`` holding hand classes, where 1 is a royal flush and
+        7462 is seven high.
+
+    Raises:
+        ValueError: If the array has the wrong shape or holds a hand that is not five
+            distinct cards.
+    """
+    cards = np.asarray(cards, dtype=np.uint32)
+    shape = np.shape(cards)
+    if len(shape) != 2 or shape[1] != 5:
+        raise ValueError(f"Expected an (N, 5) array of cards, got {shape}.")
+    # Repeated cards sort next to each other
+    ordered = np.sort(cards, axis=1)
+    if (ordered[:, 1:] == ordered[:, :-1]).any():
+        raise ValueError("Hands must comprise five distinct cards.")
+
+    masks = np.bitwise_or.reduce(cards, axis=1) >> 16
+    flush = (np.bitwise_and.reduce(cards, axis=1) & 0xF000) != 0
+    out: npt.NDArray[np.uint16] = np.where(
+        flush, _FLUSH_TABLE[masks], _UNIQUE5_TABLE[masks]
+    )
+
+    rest = out == 0
+    products = np.prod(cards[rest] & 0xFF, axis=1, dtype=np.uint32)
+    indices = np.searchsorted(_PRODUCT_KEYS, products)
+    found = indices < len(_PRODUCT_KEYS)
+    found[found] = _PRODUCT_KEYS[indices[found]] == products[found]
+    if not found.all():
+        raise ValueError("Hands must comprise five distinct cards.")
+    out[rest] = _PRODUCT_CLASSES[indices]
+
+    return out
+
+
+def evaluate_best(cards: npt.ArrayLike) -> npt.NDArray[np.uint16]:
+    """Get the classes of the best five card hands of a batch of five to seven cards.
+
+    This is the vectorised counterpart of :func:`poker.rank.seven.evaluate`, the
+    prime product of all cards is resolved by binary search and each suit is checked
+    for a flush.
+
+    Arguments:
+        cards: Array of shape ``(N, K)`` holding cards encoded with
+            :func:`poker.rank.cards.encode`, where ``K`` is five to seven.
+
+    Returns:
+        Array of shape ``(N,)`` holding hand classes, where 1 is a royal flush and
+        7462 is seven high.
+
+    Raises:
+        ValueError: If the array has the wrong shape or a hand holds more than four
+            cards of a value.
+    """
+    cards = np.asarray(cards, dtype=np.uint32)
+    shape = np.shape(cards)
+    if len(shape) != 2 or not 5 <= shape[1] <= MAX_CARDS:
+        raise ValueError(f"Expected an (N, 5) to (N, {MAX_CARDS}) array, got {shape}.")
+
+    products = np.prod(cards & 0xFF, axis=1, dtype=np.uint64)
+    indices = np.minimum(np.searchsorted(_BEST_KEYS, products), len(_BEST_KEYS) - 1)
+    if not (_BEST_KEYS[indices] == products).all():
+        raise ValueError("Hands must not hold more than four cards of a value.")
+    out: npt.NDArray[np.uint16] = _BEST_CLASSES[indices]
+
+    values = cards >> 16
+    for suit in (0x1000, 0x2000, 0x4000, 0x8000):
+        masks = np.bitwise_or.reduce(np.where(cards & suit, values, 0), axis=1)
+        flushes = _FLUSH_BEST_TABLE[masks]
+        better = (flushes != 0) & (flushes < out)
+        out[better] = flushes[better]
+
+    return out
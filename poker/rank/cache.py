@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from threading import Lock
+
+CanonicalKey = tuple[int, int, int, int]
+
+
+def canonicalize(cards: Sequence[int]) -> CanonicalKey:
+    """Get a key shared by all hands equal up to card order and a permutation of suits.
+
+    Each suit is reduced to the bit mask of its card values, which ignores card order,
+    and the masks are sorted, which ignores which suit holds which values.
+
+    Arguments:
+        cards: Cards encoded with :func:`poker.rank.cards.encode`.
+    """
+    masks = [0] * 9
+    for card in cards:
+        masks[(card >> 12) & 0xF] |= card >> 16
+    first, second, third, fourth = sorted((masks[1], masks[2], masks[4], masks[8]))
+    return first, second, third, fourth
+
+
+class CachedEvaluator:
+    """Evaluator with a bounded least recently used cache of hand classes.
+
+    Hands are cached by :func:`canonicalize`, so hand classes rather than descriptions
+    are cached and the suit of a flush is applied when the hand is described.
+
+    Attributes:
+        hits: Number of hands found in the cache.
+        misses: Number of hands evaluated.
+        evictions: Number of hands dropped to bound the size of the cache.
+    """
+
+    def __init__(self, evaluate: Callable[[Sequence[int]], int], maxsize: int) -> None:
+        self._evaluate = evaluate
+        self._cache: OrderedDict[CanonicalKey, int] = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, cards: Sequence[int]) -> int:
+        """Get the hand class of encoded cards, evaluating them on a cache miss."""
+        key = canonicalize(cards)
+        with self._lock:
+            index = self._cache.get(key)
+            if index is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return index
+
+        index = self._evaluate(cards)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = index
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+        return index
+
+    def __len__(self) -> int:
+        """Get number of cached hands."""
+        return len(self._cache)
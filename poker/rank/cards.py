@@ -0,0 +1,38 @@
+from poker.constants import Suit, Value
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_SUIT_BITS = {
+    Suit.CLUBS: 0x8,
+    Suit.DIAMONDS: 0x4,
+    Suit.HEARTS: 0x2,
+    Suit.SPADES: 0x1,
+}
+_BIT_SUITS = {bit: suit for suit, bit in _SUIT_BITS.items()}
+
+
+def encode(suit: Suit, value: Value) -> int:
+    """Encode a card as a 32-bit integer.
+
+    The layout follows Cactus Kev's poker hand evaluator::
+
+        xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+    where ``b`` is a bit flag for the card value, ``cdhs`` is the suit, ``r`` is the
+    value index (two is zero) and ``p`` is the prime associated with the value.
+    """
+    index = value - Value.TWO
+    return (1 << (16 + index)) | (_SUIT_BITS[suit] << 12) | (index << 8) | PRIMES[index]
+
+
+def suit_of(card: int) -> Suit:
+    """Decode the suit of an encoded card."""
+    return _BIT_SUITS[(card >> 12) & 0xF]
+
+
+def value_of(card: int) -> Value:
+    """Decode the value of an encoded card."""
+    return Value(((card >> 8) & 0xF) + Value.TWO)
+
+
+DECK = tuple(encode(suit, value) for suit in Suit for value in Value)
@@ -0,0 +1,66 @@
+from array import array
+from collections import Counter
+from itertools import accumulate
+from math import comb, prod
+from typing import NamedTuple
+
+from poker.constants import Rank
+from poker.rank.lookup import CLASSES, HandClass
+from poker.rank.table import HANDS
+
+
+def _hands(hand_class: HandClass) -> int:
+    """Count the five card hands in a hand class."""
+    if hand_class.suited:
+        # One per suit
+        return 4
+    ways = prod(comb(4, count) for count in Counter(hand_class.values).values())
+    if len(set(hand_class.values)) == 5:
+        # Less the flushes, which are classes of their own
+        ways -= 4
+    return ways
+
+
+def _counts() -> "array[int]":
+    """Count the five card hands in each hand class."""
+    # Every class of a rank holds as many hands, e.g. 4 for each flush
+    per_rank: dict[Rank, int] = {}
+    counts = array("I", [0])
+    for hand_class in CLASSES[1:]:
+        if hand_class.rank not in per_rank:
+            per_rank[hand_class.rank] = _hands(hand_class)
+        counts.append(per_rank[hand_class.rank])
+    return counts
+
+
+# Number of five card hands in each hand class, index zero is unused.
+COUNTS = _counts()
+# Number of hands in each hand class or a stronger one, so the hands of class ``i``
+# are counted from ``_CUMULATIVE[i - 1]`` up to ``_CUMULATIVE[i]``.
+_CUMULATIVE = array("I", accumulate(COUNTS))
+
+
+class Standing(NamedTuple):
+    """Standing of a hand among every five card hand.
+
+    Attributes:
+        percentile: Percentage of all five card hands the hand beats.
+        beaten_by: Number of hands that beat the hand.
+        ties: Number of other hands that tie with the hand.
+    """
+
+    percentile: float
+    beaten_by: int
+    ties: int
+
+
+def standing(index: int) -> Standing:
+    """Get the standing of a hand class among all 2,598,960 five card hands.
+
+    Each hand class is counted combinatorially from the suits its values can take, and
+    the counts are accumulated in order of strength when imported, so this is a pair
+    of table lookups.
+    """
+    beaten_by = _CUMULATIVE[index - 1]
+    weaker = HANDS - _CUMULATIVE[index]
+    return Standing(100 * weaker / HANDS, beaten_by, COUNTS[index] - 1)
@@ -0,0 +1,233 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from itertools import combinations, islice
+from typing import NamedTuple, Optional
+
+from loguru import logger
+
+from poker.constants import Rank, Value
+from poker.models import Card, Hand
+from poker.rank import lookup, table
+from poker.rank.cards import DECK, suit_of, value_of
+from poker.rank.hands import rank_hand
+
+# Environment variable naming the engine to evaluate hands with.
+ENVIRONMENT = "POKER_RANK_ENGINE"
+# Environment variable holding the path of the table mapped by the table engine.
+TABLE_ENVIRONMENT = "POKER_RANK_TABLE"
+DEFAULT = "lookup"
+
+_STRAIGHTS = {Rank.ROYAL_FLUSH, Rank.STRAIGHT_FLUSH, Rank.STRAIGHT}
+_ACE_LOW = [Value.ACE, Value.FIVE, Value.FOUR, Value.THREE, Value.TWO]
+
+
+class Engine(ABC):
+    """Evaluator of five card hands, chosen by name.
+
+    Engines agree on the hand class of every hand, where 1 is a royal flush and 7462
+    is seven high, and differ only in how fast they find it.
+    """
+
+    @abstractmethod
+    def evaluate(self, hands: Sequence[Sequence[int]]) -> list[int]:
+        """Get the hand class of each of a batch of encoded hands."""
+
+    def __call__(self, cards: Sequence[int]) -> int:
+        """Get the hand class of five encoded cards."""
+        return self.evaluate([cards])[0]
+
+
+ENGINES: dict[str, Callable[[], Engine]] = {}
+
+
+def register(name: str) -> Callable[[type[Engine]], type[Engine]]:
+    """Register an engine class under a name, to create it by :func:`create`."""
+
+    def decorator(engine: type[Engine]) -> type[Engine]:
+        ENGINES[name] = engine
+        return engine
+
+    return decorator
+
+
+@register("reference")
+class ReferenceEngine(Engine):
+    """Engine testing each rule of :mod:`poker.rank.hands` in turn.
+
+    The rules find the rank of a hand, and its class within the rank follows from its
+    card values ordered by significance, without any of the lookup tables.
+    """
+
+    def __init__(self) -> None:
+        self._classes = {
+            (hand_class.rank, hand_class.values): index
+            for index, hand_class in enumerate(lookup.CLASSES[1:], start=1)
+        }
+
+    def evaluate(self, hands: Sequence[Sequence[int]]) -> list[int]:
+        """Get the hand class of each of a batch of encoded hands."""
+        return [self(cards) for cards in hands]
+
+    def __call__(self, cards: Sequence[int]) -> int:
+        """Get the hand class of five encoded cards."""
+        # Encoded cards are valid, so skip validating the models
+        hand = Hand.construct(
+            cards=[Card.construct(suit=suit_of(c), value=value_of(c)) for c in cards]
+        )
+        rank = rank_hand(hand).rank
+        if rank in _STRAIGHTS:
+            values = sorted((card.value for card in hand.cards), reverse=True)
+            if values == _ACE_LOW:
+                values = values[1:] + values[:1]
+        else:
+            counts = sorted(
+                hand.value_counts, key=lambda item: (item[1], item[0]), reverse=True
+            )
+            values = [value for value, count in counts for _ in range(count)]
+        return self._classes[rank, tuple(values)]
+
+
+@register("lookup")
+class LookupEngine(Engine):
+    """Engine indexing the lookup tables of :mod:`poker.rank.lookup` per hand."""
+
+    def evaluate(self, hands: Sequence[Sequence[int]]) -> list[int]:
+        """Get the hand class of each of a batch of encoded hands."""
+        return [lookup.evaluate(cards) for cards in hands]
+
+    def __call__(self, cards: Sequence[int]) -> int:
+        """Get the hand class of five encoded cards."""
+        return lookup.evaluate(cards)
+
+
+@register("table")
+class TableEngine(Engine):
+    """Engine reading hand classes from a table of every five card hand.
+
+    Arguments:
+        path: Table file written by :func:`poker.rank.table.write` to map, defaults to
+            the ``POKER_RANK_TABLE`` environment variable. Without one the table is
+            built in memory.
+
+    Raises:
+        OSError: If the table file cannot be read.
+        ValueError: If the table file is stale or corrupt.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        path = path or os.environ.get(TABLE_ENVIRONMENT)
+        self._table: Callable[[Sequence[int]], int]
+        if path:
+            self._table = table.HandTable(path)
+        else:
+            classes = table.build()
+            self._table = lambda cards: classes[table.hand_index(cards)]
+
+    def evaluate(self, hands: Sequence[Sequence[int]]) -> list[int]:
+        """Get the hand class of each of a batch of encoded hands."""
+        return [self._table(cards) for cards in hands]
+
+    def __call__(self, cards: Sequence[int]) -> int:
+        """Get the hand class of five encoded cards."""
+        return self._table(cards)
+
+
+@register("batch")
+class BatchEngine(Engine):
+    """Engine evaluating whole batches at once with NumPy."""
+
+    def __init__(self) -> None:
+        # NumPy is imported on first use so the API imports quickly
+        from poker.rank import batch
+
+        self._evaluate = batch.evaluate
+
+    def evaluate(self, hands: Sequence[Sequence[int]]) -> list[int]:
+        """Get the hand class of each of a batch of encoded hands."""
+        classes: list[int] = self._evaluate(hands).tolist()
+        return classes
+
+
+def create(name: str) -> Engine:
+    """Create an engine by name.
+
+    Raises:
+        ValueError: If no engine has the name.
+    """
+    if name not in ENGINES:
+        raise ValueError(
+            f"Unknown engine {name!r}, expected one of {', '.join(sorted(ENGINES))}."
+        )
+    return ENGINES[name]()
+
+
+def configured() -> Engine:
+    """Create the engine named by the ``POKER_RANK_ENGINE`` environment variable.
+
+    The table engine is chosen if only ``POKER_RANK_TABLE`` is set and the lookup
+    engine if neither is.
+
+    Returns:
+        The configured engine, or the lookup engine if it cannot be created.
+    """
+    name = os.environ.get(ENVIRONMENT) or (
+        "table" if os.environ.get(TABLE_ENVIRONMENT) else DEFAULT
+    )
+    try:
+        return create(name)
+    except (OSError, ValueError) as error:
+        logger.warning(f"Falling back to the {DEFAULT} engine: {error}")
+        return create(DEFAULT)
+
+
+class Mismatch(NamedTuple):
+    """Hand an engine ranks differently from the reference.
+
+    Attributes:
+        cards: Encoded cards of the hand.
+        expected: Hand class found by the reference engine.
+        actual: Hand class found by the engine under test.
+    """
+
+    cards: tuple[int, ...]
+    expected: int
+    actual: int
+
+
+def all_hands(start: int = 0, stop: Optional[int] = None) -> Iterator[tuple[int, ...]]:
+    """Generate every five card hand, or a slice of them, in a fixed order."""
+    return islice(combinations(DECK, 5), start, stop)
+
+
+@cache
+def _engine(name: str) -> Engine:
+    """Get an engine created once per process."""
+    return create(name)
+
+
+def compare(name: str, start: int, stop: int) -> tuple[float, list[Mismatch]]:
+    """Compare an engine with the reference over a slice of :func:`all_hands`.
+
+    Arguments:
+        name: Engine to test.
+        start: Index of the first hand.
+        stop: Index after the last hand.
+
+    Returns:
+        Seconds the engine under test took and the hands it got wrong.
+    """
+    batch = list(all_hands(start, stop))
+    expected = _engine("reference").evaluate(batch)
+    engine = _engine(name)
+    begin = time.perf_counter()
+    actual = engine.evaluate(batch)
+    seconds = time.perf_counter() - begin
+    mismatches = [
+        Mismatch(cards, want, got)
+        for cards, want, got in zip(batch, expected, actual)
+        if want != got
+    ]
+    return seconds, mismatches
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Optional, Union
 
 from poker.constants import Rank, Value
@@ -139,7 +140,9 @@ def high_card(hand: Hand) -> dict[str, Union[str, int]]:
     return {"value": max(hand.cards).value}
 
 
-_FUNCTIONS = {
+# Rule for each rank, from the strongest down. Each returns the fields of the rank
+# description if the hand has the rank, or nothing.
+_RULES: dict[Rank, Callable[[Hand], dict[str, Union[str, int]]]] = {
     Rank.ROYAL_FLUSH: royal_flush,
     Rank.STRAIGHT_FLUSH: straight_flush,
     Rank.FOUR_OF_A_KIND: four_of_a_kind,
@@ -154,19 +157,18 @@ _FUNCTIONS = {
 
 
 def rank_hand(hand: Hand) -> RankedHand:
-    """Get hand rank.
+    """Get hand rank from the first rule the hand satisfies.
 
-    TODO: Use a factory pattern to avoid this huge flow control.
+    This is the reference implementation, see :mod:`poker.rank.engines` for the
+    faster engines checked against it.
     """
-    out = None
-    for rank, func in _FUNCTIONS.items():
-        result = func(hand)
-        if result:
+    for rank, rule in _RULES.items():
+        fields = rule(hand)
+        if fields:
             return RankedHand(
                 cards=hand.cards,
                 rank=rank,
-                description=DESCRIPTIONS[rank].format(**result),
+                description=DESCRIPTIONS[rank].format(**fields),
             )
 
-    if out is None:
-        raise ValueError("No rank found.")
+    raise ValueError("No rank found.")
@@ -0,0 +1,166 @@
+from collections.abc import Iterable
+from typing import Optional
+
+from poker.constants import Rank, Value
+from poker.parser import format_card
+from poker.rank import seven
+from poker.rank.cards import suit_of
+from poker.rank.descriptions import DESCRIPTIONS
+from poker.rank.lookup import CLASSES, describe
+from poker.rank.seven import MAX_CARDS
+
+_FLUSH_BEST, _PRODUCT_BEST = seven.tables()
+_VALUES = [Value(index + Value.TWO) for index in range(13)]
+# Suit bits and the shift of the lane of values of each suit, from spades up to clubs
+_LANES = ((0x1, 0), (0x2, 16), (0x4, 32), (0x8, 48))
+_SHIFTS = [dict(_LANES).get(bits, 0) for bits in range(9)]
+
+
+class IncrementalHand:
+    """Cards dealt street by street, with the best hand kept up to date as they arrive.
+
+    The state is a handful of integers: a 13-bit mask of values per suit, a histogram
+    of values packed three bits per value, the prime product of the values and the
+    best hand class so far. Adding a card updates each in constant time and looks up
+    only the hands the card can improve, the best of its values by prime product and
+    the best flush of its suit. Forking copies the integers, so branching over every
+    possible next card is cheap.
+
+    Arguments:
+        cards: Cards encoded with :func:`poker.rank.cards.encode` to start with.
+
+    Raises:
+        ValueError: If a card is repeated or there are more than seven cards.
+    """
+
+    __slots__ = ("_suits", "_histogram", "_product", "_count", "_best", "_suit")
+
+    def __init__(self, cards: Iterable[int] = ()) -> None:
+        # Value mask of each suit, in 16-bit lanes from spades up to clubs
+        self._suits = 0
+        self._histogram = 0
+        self._product = 1
+        self._count = 0
+        # Best hand class, zero until there are five cards
+        self._best = 0
+        # Suit bits of the best hand, which only matter if it is suited
+        self._suit = 0x1
+        self.extend(cards)
+
+    def add(self, card: int) -> None:
+        """Add a card, updating the best hand.
+
+        Raises:
+            ValueError: If the card was already added or there are seven cards.
+        """
+        if self._count == MAX_CARDS:
+            raise ValueError(f"Hand cannot have more than {MAX_CARDS} cards.")
+        suit = (card >> 12) & 0xF
+        shift = _SHIFTS[suit]
+        if self._suits >> shift & card >> 16:
+            raise ValueError(f"Hand contains duplicate card: {format_card(card)!r}.")
+        self._suits |= (card >> 16) << shift
+        self._histogram += 1 << 3 * ((card >> 8) & 0xF)
+        self._product *= card & 0xFF
+        self._count += 1
+        if self._count < 5:
+            return
+
+        best = _PRODUCT_BEST[self._product]
+        if self._best and self._best < best:
+            best = self._best
+        # Only the suit of the new card can have gained a flush
+        flush = _FLUSH_BEST[(self._suits >> shift) & 0x1FFF]
+        if flush and flush < best:
+            best, self._suit = flush, suit
+        self._best = best
+
+    def extend(self, cards: Iterable[int]) -> None:
+        """Add cards, e.g. the flop, updating the best hand as each is added.
+
+        Raises:
+            ValueError: If a card was already added or there would be more than seven
+                cards, in which case none of the cards are added.
+        """
+        # Add the cards to a copy, so none are added if one cannot be
+        hand = self.fork()
+        for card in cards:
+            hand.add(card)
+        self._take(hand)
+
+    def fork(self) -> "IncrementalHand":
+        """Copy the hand, to add cards to the copy without changing this one."""
+        other = IncrementalHand.__new__(IncrementalHand)
+        other._take(self)
+        return other
+
+    def _take(self, other: "IncrementalHand") -> None:
+        """Take the cards and best hand of another hand."""
+        self._suits = other._suits
+        self._histogram = other._histogram
+        self._product = other._product
+        self._count = other._count
+        self._best = other._best
+        self._suit = other._suit
+
+    def __contains__(self, card: int) -> bool:
+        """Check whether a card has been added."""
+        return bool(self._suits >> _SHIFTS[(card >> 12) & 0xF] & card >> 16)
+
+    def __len__(self) -> int:
+        """Get number of cards added."""
+        return self._count
+
+    @property
+    def hand_class(self) -> Optional[int]:
+        """Class of the best five card hand, or None if there are fewer cards."""
+        return self._best or None
+
+    @property
+    def counts(self) -> list[int]:
+        """Number of cards of each value, from two up to ace."""
+        return [(self._histogram >> 3 * index) & 0x7 for index in range(13)]
+
+    def _made(self) -> tuple[Rank, str]:
+        """Get the rank and description of the sets of values in fewer than five cards.
+
+        Fewer than five cards cannot make a straight or flush, so they rank by their
+        largest sets of a value alone.
+        """
+        (count, value), (second, low) = sorted(zip(self.counts, _VALUES), reverse=True)[
+            :2
+        ]
+        if count == 4:
+            rank, fields = Rank.FOUR_OF_A_KIND, {"value": value}
+        elif count == 3:
+            rank, fields = Rank.THREE_OF_A_KIND, {"value": value}
+        elif count == 2 and second == 2:
+            rank, fields = Rank.TWO_PAIR, {"high": value, "low": low}
+        elif count == 2:
+            rank, fields = Rank.PAIR, {"value": value}
+        else:
+            rank, fields = Rank.HIGH_CARD, {"value": value}
+        return rank, DESCRIPTIONS[rank].format(**fields)
+
+    def ranked(self) -> tuple[Rank, str]:
+        """Get the rank and description of the best hand so far.
+
+        Raises:
+            ValueError: If there are no cards.
+        """
+        if self._best:
+            index = self._best
+            return CLASSES[index].rank, describe(index, suit_of(self._suit << 12))
+        if not self._count:
+            raise ValueError("Hand has no cards.")
+        return self._made()
+
+    @property
+    def rank(self) -> Optional[Rank]:
+        """Rank of the best hand so far, or None if there are no cards."""
+        return self.ranked()[0] if self._count else None
+
+    @property
+    def description(self) -> Optional[str]:
+        """Description of the best hand so far, or None if there are no cards."""
+        return self.ranked()[1] if self._count else None
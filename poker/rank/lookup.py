@@ -0,0 +1,219 @@
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import combinations
+from math import prod
+from typing import NamedTuple
+
+from poker.constants import Rank, Suit, Value
+from poker.models import Hand, RankedHand
+from poker.rank import shared
+from poker.rank.cards import PRIMES, encode, suit_of
+from poker.rank.descriptions import DESCRIPTIONS
+
+# Number of distinct five card hand classes, from the royal flush (1) down to seven
+# high (7462).
+HAND_CLASSES = 7462
+
+_VALUES = sorted(Value, reverse=True)
+_SUITED = {Rank.ROYAL_FLUSH, Rank.STRAIGHT_FLUSH, Rank.FLUSH}
+
+
+class HandClass(NamedTuple):
+    """Equivalence class of five card hands.
+
+    Attributes:
+        rank: Rank category of the class.
+        values: Card values ordered by significance, e.g. trips before kickers.
+        description: Description of the class, with ``{suit}`` left unformatted for
+            suited ranks.
+    """
+
+    rank: Rank
+    values: tuple[Value, ...]
+    description: str
+
+    @property
+    def suited(self) -> bool:
+        """Whether hands of the class are all of one suit."""
+        return self.rank in _SUITED
+
+
+def _mask(values: Sequence[Value]) -> int:
+    """Bit mask of card values, as held in the top bits of an encoded card."""
+    return sum(1 << (value - Value.TWO) for value in values)
+
+
+def _product(values: Sequence[Value]) -> int:
+    """Product of the primes associated with card values."""
+    return prod(PRIMES[value - Value.TWO] for value in values)
+
+
+def _straights() -> list[tuple[Value, ...]]:
+    """List straights from ace high down to five high."""
+    out = [tuple(Value(high - i) for i in range(5)) for high in range(14, 5, -1)]
+    return out + [(Value.FIVE, Value.FOUR, Value.THREE, Value.TWO, Value.ACE)]
+
+
+def _classes() -> Iterator[HandClass]:
+    """Generate every hand class from strongest to weakest."""
+    straights = _straights()
+    straight_masks = {_mask(values) for values in straights}
+    distinct = [v for v in combinations(_VALUES, 5) if _mask(v) not in straight_masks]
+
+    def describe(rank: Rank, **kwargs: Value) -> str:
+        if rank in _SUITED:
+            kwargs["suit"] = "{suit}"  # type: ignore[assignment]
+        return DESCRIPTIONS[rank].format(**kwargs)
+
+    royal, *straight_flushes = straights
+    yield HandClass(Rank.ROYAL_FLUSH, royal, describe(Rank.ROYAL_FLUSH))
+    for values in straight_flushes:
+        yield HandClass(
+            Rank.STRAIGHT_FLUSH, values, describe(Rank.STRAIGHT_FLUSH, high=values[0])
+        )
+
+    for quads in _VALUES:
+        for kicker in (v for v in _VALUES if v != quads):
+            yield HandClass(
+                Rank.FOUR_OF_A_KIND,
+                4 * (quads,) + (kicker,),
+                describe(Rank.FOUR_OF_A_KIND, value=quads),
+            )
+
+    for trips in _VALUES:
+        for pair in (v for v in _VALUES if v != trips):
+            yield HandClass(
+                Rank.FULL_HOUSE,
+                3 * (trips,) + 2 * (pair,),
+                describe(Rank.FULL_HOUSE, trips=trips, pair=pair),
+            )
+
+    for values in distinct:
+        yield HandClass(Rank.FLUSH, values, describe(Rank.FLUSH))
+
+    for values in straights:
+        yield HandClass(Rank.STRAIGHT, values, describe(Rank.STRAIGHT, high=values[0]))
+
+    for trips in _VALUES:
+        for kickers in combinations((v for v in _VALUES if v != trips), 2):
+            yield HandClass(
+                Rank.THREE_OF_A_KIND,
+                3 * (trips,) + kickers,
+                describe(Rank.THREE_OF_A_KIND, value=trips),
+            )
+
+    for high, low in combinations(_VALUES, 2):
+        for kicker in (v for v in _VALUES if v not in (high, low)):
+            yield HandClass(
+                Rank.TWO_PAIR,
+                2 * (high,) + 2 * (low,) + (kicker,),
+                describe(Rank.TWO_PAIR, high=high, low=low),
+            )
+
+    for pair in _VALUES:
+        for others in combinations((v for v in _VALUES if v != pair), 3):
+            yield HandClass(
+                Rank.PAIR, 2 * (pair,) + others, describe(Rank.PAIR, value=pair)
+            )
+
+    for values in distinct:
+        yield HandClass(
+            Rank.HIGH_CARD, values, describe(Rank.HIGH_CARD, value=values[0])
+        )
+
+
+# Index zero is unused so hand classes can be looked up directly.
+CLASSES: list[HandClass] = [HandClass(Rank.HIGH_CARD, (), ""), *_classes()]
+
+
+def _tables() -> tuple["array[int]", "array[int]", dict[int, int]]:
+    """Build the flush, distinct value and prime product lookup tables."""
+    flushes = array("H", bytes(2 * 8192))
+    unique5 = array("H", bytes(2 * 8192))
+    products = {}
+    for index, hand_class in enumerate(CLASSES[1:], start=1):
+        if hand_class.suited:
+            flushes[_mask(hand_class.values)] = index
+        elif len(set(hand_class.values)) == 5:
+            unique5[_mask(hand_class.values)] = index
+        else:
+            products[_product(hand_class.values)] = index
+    return flushes, unique5, products
+
+
+_FLUSHES: Sequence[int]
+_UNIQUE5: Sequence[int]
+_PRODUCTS: Mapping[int, int]
+# Worker processes map tables built once by their parent if there are any
+_SHARED = shared.attach()
+if _SHARED is None:
+    _FLUSHES, _UNIQUE5, _PRODUCTS = _tables()
+else:
+    _FLUSHES, _UNIQUE5, _PRODUCTS = _SHARED.flushes, _SHARED.unique5, _SHARED.products
+
+
+def tables() -> tuple[Sequence[int], Sequence[int], Mapping[int, int]]:
+    """Get the flush, distinct value and prime product lookup tables.
+
+    Returns:
+        Hand classes of flushes and of hands of five distinct values by bit mask of
+        values, and of every other hand by prime product.
+    """
+    return _FLUSHES, _UNIQUE5, _PRODUCTS
+
+
+def evaluate(cards: Sequence[int]) -> int:
+    """Get the hand class of five encoded cards.
+
+    Flushes and hands of five distinct values are found by indexing a table with the
+    bit mask of card values, every other hand by the product of card value primes.
+
+    Arguments:
+        cards: Five cards encoded with :func:`poker.rank.cards.encode`.
+
+    Returns:
+        Hand class, where 1 is a royal flush and 7462 is seven high.
+    """
+    c1, c2, c3, c4, c5 = cards
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return _FLUSHES[(c1 | c2 | c3 | c4 | c5) >> 16]
+
+    index = _UNIQUE5[(c1 | c2 | c3 | c4 | c5) >> 16]
+    if index:
+        return index
+
+    return _PRODUCTS[
+        (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+    ]
+
+
+def describe(index: int, suit: Suit) -> str:
+    """Get description of a hand class, given the suit of any card in the hand."""
+    hand_class = CLASSES[index]
+    if hand_class.suited:
+        return hand_class.description.format(suit=suit)
+    return hand_class.description
+
+
+def strength(index: int) -> int:
+    """Get strength of a hand class, from 1 for seven high to 7462 for a royal flush.
+
+    Hand classes count down from the best hand like :class:`poker.constants.Rank`,
+    strengths count up instead so stronger hands compare greater, kickers included.
+    """
+    return HAND_CLASSES + 1 - index
+
+
+def rank_cards(cards: Sequence[int]) -> tuple[Rank, str]:
+    """Get rank and description of five encoded cards."""
+    index = evaluate(cards)
+    return CLASSES[index].rank, describe(index, suit_of(cards[0]))
+
+
+def rank_hand(hand: Hand) -> RankedHand:
+    """Get hand rank using precomputed lookup tables."""
+    rank, description = rank_cards(
+        [encode(card.suit, card.value) for card in hand.cards]
+    )
+    # Cards have already been validated by the hand so skip validation here
+    return RankedHand.construct(cards=hand.cards, rank=rank, description=description)
@@ -0,0 +1,121 @@
+from array import array
+from collections.abc import Mapping, Sequence
+
+from poker.constants import Value
+from poker.rank import lookup, shared
+from poker.rank.cards import PRIMES
+from poker.rank.lookup import CLASSES, _product
+
+# Largest number of cards in a hand, e.g. two hole cards and five board cards.
+MAX_CARDS = 7
+
+
+def _flush_table() -> "array[int]":
+    """Best flush class for every bit mask of five to seven values of one suit."""
+    flushes, _, _ = lookup.tables()
+    table = array("H", flushes)
+    for count in range(6, MAX_CARDS + 1):
+        for mask in range(1 << 13):
+            if mask.bit_count() == count:
+                table[mask] = min(
+                    table[mask & ~(1 << bit)] for bit in range(13) if mask >> bit & 1
+                )
+    return table
+
+
+def _product_table() -> dict[int, int]:
+    """Best class for every prime product of five to seven values, ignoring suits."""
+    table = {
+        _product(hand_class.values): index
+        for index, hand_class in enumerate(CLASSES[1:], start=1)
+        if not hand_class.suited
+    }
+    previous = table
+    for _ in range(6, MAX_CARDS + 1):
+        # Extend each smaller hand by one value, allowing at most four of a value
+        current: dict[int, int] = {}
+        for product, index in previous.items():
+            for prime in PRIMES:
+                if product % prime**4:
+                    key = product * prime
+                    current[key] = min(index, current.get(key, index))
+        table |= current
+        previous = current
+    return table
+
+
+_FLUSH_BEST: Sequence[int]
+_PRODUCT_BEST: Mapping[int, int]
+# Shared between worker processes like the tables of poker.rank.lookup
+_SHARED = shared.attach()
+if _SHARED is None:
+    _FLUSH_BEST, _PRODUCT_BEST = _flush_table(), _product_table()
+else:
+    _FLUSH_BEST, _PRODUCT_BEST = _SHARED.flush_best, _SHARED.product_best
+
+
+def tables() -> tuple[Sequence[int], Mapping[int, int]]:
+    """Get the best flush and best prime product lookup tables.
+
+    Returns:
+        Best hand classes of five to seven cards by bit mask of the values of a suit,
+        and by prime product of all values.
+    """
+    return _FLUSH_BEST, _PRODUCT_BEST
+
+
+def evaluate(cards: Sequence[int]) -> int:
+    """Get the class of the best five card hand among five to seven encoded cards.
+
+    Values are resolved by the prime product of all cards and flushes by the bit mask
+    of values in each suit, so no five card combinations are enumerated.
+
+    Arguments:
+        cards: Five to seven cards encoded with :func:`poker.rank.cards.encode`.
+
+    Returns:
+        Hand class, where 1 is a royal flush and 7462 is seven high.
+    """
+    product = 1
+    masks = [0] * 9
+    for card in cards:
+        product *= card & 0xFF
+        masks[(card >> 12) & 0xF] |= card >> 16
+
+    best = _PRODUCT_BEST[product]
+    for mask in (masks[1], masks[2], masks[4], masks[8]):
+        flush = _FLUSH_BEST[mask]
+        if flush and flush < best:
+            best = flush
+
+    return best
+
+
+def best_five(cards: Sequence[int]) -> tuple[int, list[int]]:
+    """Get the best five card hand among five to seven encoded cards.
+
+    Returns:
+        Hand class and the five cards making it, ordered by significance.
+    """
+    index = evaluate(cards)
+    hand_class = CLASSES[index]
+
+    remaining = list(cards)
+    if hand_class.suited:
+        # Only one suit can hold five of seven cards
+        suit = next(
+            card & 0xF000
+            for card in cards
+            if sum(1 for other in cards if other & card & 0xF000) >= 5
+        )
+        remaining = [card for card in cards if card & suit]
+
+    five = []
+    for value in hand_class.values:
+        card = next(
+            card for card in remaining if (card >> 8) & 0xF == value - Value.TWO
+        )
+        remaining.remove(card)
+        five.append(card)
+
+    return index, five
@@ -0,0 +1,218 @@
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from functools import cache
+from typing import IO, Optional
+
+from loguru import logger
+
+# Environment variable holding the path of the tables for worker processes to map.
+ENVIRONMENT = "POKER_SHARED_TABLES"
+# Tables format version, bumped like poker.rank.table.VERSION.
+VERSION = 1
+
+_MAGIC = b"PKST"
+# Magic, version, slots of the five and seven card product tables and CRC-32 of the
+# tables, padded so the 64-bit keys that follow are aligned. Tables are written in
+# native byte order, as they are mapped on the host that wrote them.
+_HEADER = struct.Struct("<4sIIII4x")
+# Entries in each table indexed by a bit mask of card values.
+_MASKS = 1 << 13
+
+
+def _prime_at_least(number: int) -> int:
+    """Get the smallest prime not less than a number."""
+    while any(number % divisor == 0 for divisor in range(2, int(number**0.5) + 1)):
+        number += 1
+    return number
+
+
+def _pack(products: Mapping[int, int]) -> tuple["array[int]", "array[int]"]:
+    """Lay out a product table as open addressed keys and hand classes.
+
+    There are twice as many slots as products, and the number of slots is prime so
+    products, which are mostly odd, spread evenly over the slots.
+    """
+    slots = _prime_at_least(2 * len(products))
+    keys = array("Q", bytes(8 * slots))
+    classes = array("H", bytes(2 * slots))
+    for product, index in products.items():
+        slot = product % slots
+        while keys[slot]:
+            slot = (slot + 1) % slots
+        keys[slot] = product
+        classes[slot] = index
+    return keys, classes
+
+
+class ProductTable(Mapping[int, int]):
+    """Read only hash table of prime products to hand classes, over shared buffers.
+
+    Arguments:
+        keys: Products, or zero for an empty slot, as laid out by linear probing.
+        classes: Hand class of the product in the same slot.
+    """
+
+    def __init__(self, keys: Sequence[int], classes: Sequence[int]) -> None:
+        self._keys = keys
+        self._classes = classes
+        self._slots = len(keys)
+
+    def __getitem__(self, product: int) -> int:
+        """Get the hand class of a product."""
+        keys = self._keys
+        slot = product % self._slots
+        while (key := keys[slot]) != product:
+            if not key:
+                raise KeyError(product)
+            slot += 1
+            if slot == self._slots:
+                slot = 0
+        return self._classes[slot]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over products."""
+        return (key for key in self._keys if key)
+
+    def __len__(self) -> int:
+        """Get number of products."""
+        return sum(1 for key in self._keys if key)
+
+
+def write(
+    file: IO[bytes],
+    flushes: Sequence[int],
+    unique5: Sequence[int],
+    products: Mapping[int, int],
+    flush_best: Sequence[int],
+    product_best: Mapping[int, int],
+) -> None:
+    """Write the five and seven card lookup tables for :class:`SharedTables` to map.
+
+    Arguments:
+        file: File to write to.
+        flushes: Five card flush classes by bit mask of values.
+        unique5: Five card classes of distinct values by bit mask of values.
+        products: Five card classes of every other hand by prime product.
+        flush_best: Best flush classes of five to seven cards by bit mask of values.
+        product_best: Best classes of five to seven cards by prime product.
+    """
+    product_keys, product_classes = _pack(products)
+    best_keys, best_classes = _pack(product_best)
+    sections: list["array[int]"] = [
+        product_keys,
+        best_keys,
+        product_classes,
+        best_classes,
+        array("H", flushes),
+        array("H", unique5),
+        array("H", flush_best),
+    ]
+    data = b"".join(section.tobytes() for section in sections)
+    file.write(
+        _HEADER.pack(
+            _MAGIC, VERSION, len(product_keys), len(best_keys), zlib.crc32(data)
+        )
+    )
+    file.write(data)
+
+
+class SharedTables:
+    """Lookup tables read from a memory-mapped file written by :func:`write`.
+
+    The file is mapped read only, so every process mapping it shares one copy of the
+    tables in the page cache rather than building its own.
+
+    Arguments:
+        path: File written by :func:`write`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file holds no tables, tables of another version or does
+            not match its checksum.
+
+    Attributes:
+        flushes: Five card flush classes by bit mask of values.
+        unique5: Five card classes of distinct values by bit mask of values.
+        products: Five card classes of every other hand by prime product.
+        flush_best: Best flush classes of five to seven cards by bit mask of values.
+        product_best: Best classes of five to seven cards by prime product.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            product_slots, best_slots, data = self._validate(path)
+        except ValueError:
+            self._map.close()
+            raise
+        self._views = [data]
+        offset = 0
+
+        def section(code: str, length: int) -> memoryview:
+            nonlocal offset
+            size = struct.calcsize(code) * length
+            view = data[offset : offset + size].cast(code)
+            self._views.append(view)
+            offset += size
+            return view
+
+        product_keys = section("Q", product_slots)
+        best_keys = section("Q", best_slots)
+        self.products = ProductTable(product_keys, section("H", product_slots))
+        self.product_best = ProductTable(best_keys, section("H", best_slots))
+        self.flushes: Sequence[int] = section("H", _MASKS)
+        self.unique5: Sequence[int] = section("H", _MASKS)
+        self.flush_best: Sequence[int] = section("H", _MASKS)
+
+    def _validate(self, path: str) -> tuple[int, int, memoryview]:
+        """Check the header and checksum, returning the slots and the tables."""
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"Shared tables {path} are truncated.")
+        magic, version, product_slots, best_slots, checksum = _HEADER.unpack_from(
+            self._map
+        )
+        if magic != _MAGIC:
+            raise ValueError(f"{path} does not hold shared tables.")
+        if version != VERSION:
+            raise ValueError(f"Shared tables {path} are stale, version {version}.")
+
+        data = memoryview(self._map)[_HEADER.size :]
+        if (
+            len(data) != 10 * (product_slots + best_slots) + 3 * 2 * _MASKS
+            or zlib.crc32(data) != checksum
+        ):
+            data.release()
+            raise ValueError(f"Shared tables {path} do not match their checksum.")
+
+        return product_slots, best_slots, data
+
+    def close(self) -> None:
+        """Unmap the tables file, after which the tables cannot be read."""
+        for view in reversed(self._views):
+            view.release()
+        self._map.close()
+
+
+@cache
+def attach() -> Optional[SharedTables]:
+    """Map the tables named by the ``POKER_SHARED_TABLES`` environment variable.
+
+    Returns:
+        Tables shared with other processes, or None if none are configured or they
+        cannot be mapped, in which case each process builds its own.
+    """
+    path = os.environ.get(ENVIRONMENT)
+    if not path:
+        return None
+
+    try:
+        return SharedTables(path)
+    except (OSError, ValueError) as error:
+        logger.warning(f"Building lookup tables instead of sharing them: {error}")
+        return None
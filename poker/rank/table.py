@@ -0,0 +1,120 @@
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+from math import comb
+from typing import BinaryIO
+
+from poker.rank.cards import DECK
+from poker.rank.lookup import evaluate
+
+# Number of five card hands, one table entry each.
+HANDS = comb(len(DECK), 5)
+# Table format version, bumped whenever the layout or the hand classes change.
+VERSION = 1
+
+_MAGIC = b"PKRT"
+# Magic, version, number of entries and CRC-32 of the entries, little endian.
+_HEADER = struct.Struct("<4sIII")
+
+_INDEX = {card: index for index, card in enumerate(DECK)}
+_C2, _C3, _C4, _C5 = ([comb(n, k) for n in range(len(DECK))] for k in range(2, 6))
+
+
+def hand_index(cards: Sequence[int]) -> int:
+    """Get the combinatorial rank of five encoded cards, from 0 to ``HANDS - 1``.
+
+    Cards are ranked by their position in :data:`poker.rank.cards.DECK`, in
+    colexicographic order, so the hands are numbered in the order :func:`build`
+    enumerates them.
+    """
+    a, b, c, d, e = sorted([_INDEX[card] for card in cards])
+    return a + _C2[b] + _C3[c] + _C4[d] + _C5[e]
+
+
+def build() -> "array[int]":
+    """Evaluate every five card hand, in order of :func:`hand_index`.
+
+    Returns:
+        Hand class of each hand, which identifies both its rank category and its
+        description.
+    """
+    table = array("H")
+    for e in range(4, len(DECK)):
+        for d in range(3, e):
+            for c in range(2, d):
+                for b in range(1, c):
+                    cards = [DECK[b], DECK[c], DECK[d], DECK[e], 0]
+                    for a in range(b):
+                        cards[4] = DECK[a]
+                        table.append(evaluate(cards))
+    return table
+
+
+def write(file: BinaryIO, table: "array[int]") -> None:
+    """Write a table built by :func:`build` with a header holding its checksum."""
+    if sys.byteorder != "little":
+        table = array("H", table)
+        table.byteswap()
+    data = table.tobytes()
+    file.write(_HEADER.pack(_MAGIC, VERSION, len(table), zlib.crc32(data)))
+    file.write(data)
+
+
+class HandTable:
+    """Evaluator reading hand classes from a memory-mapped table file.
+
+    The file is mapped read only, so processes mapping the same file share one copy
+    of it in the page cache.
+
+    Arguments:
+        path: File written by :func:`write`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a table, is of another version or does not
+            match its checksum.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._classes = self._validate(path)
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _validate(self, path: str) -> "memoryview":
+        """Check the header and checksum, returning a view of the entries."""
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"Hand table {path} is truncated.")
+        magic, version, count, checksum = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a hand table.")
+        if version != VERSION or count != HANDS:
+            raise ValueError(
+                f"Hand table {path} is stale, version {version} of {count} hands."
+            )
+        if sys.byteorder != "little":
+            raise ValueError("Hand tables can only be mapped on little endian hosts.")
+
+        data = memoryview(self._map)[_HEADER.size :]
+        if len(data) != 2 * HANDS or zlib.crc32(data) != checksum:
+            data.release()
+            raise ValueError(f"Hand table {path} does not match its checksum.")
+
+        return data.cast("H")
+
+    def __call__(self, cards: Sequence[int]) -> int:
+        """Get the hand class of five encoded cards."""
+        index: int = self._classes[hand_index(cards)]
+        return index
+
+    def close(self) -> None:
+        """Unmap the table file."""
+        self._classes.release()
+        self._map.close()
@@ -0,0 +1,30 @@
+import json
+
+from poker.parser import parse_hand, read_hand
+from poker.rank import rank_cards
+
+MAX_LINE = 64 * 1024
+
+
+def rank_line(line: bytes) -> str:
+    """Rank a line of input, returning a JSON result line.
+
+    Arguments:
+        line: A hand as read by :func:`poker.parser.read_hand`.
+
+    Returns:
+        JSON object holding either a ``description`` or an ``error``, terminated by a
+        newline.
+    """
+    if len(line) > MAX_LINE:
+        return json.dumps({"error": "Line too long."}) + "\n"
+    try:
+        _, description = rank_cards(parse_hand(read_hand(line.decode())))
+    except ValueError as error:
+        return json.dumps({"error": str(error)}) + "\n"
+    return json.dumps({"description": description}) + "\n"
+
+
+def rank_lines(lines: list[bytes]) -> bytes:
+    """Rank lines of input, skipping blank lines."""
+    return "".join(rank_line(line) for line in lines if line.strip()).encode()
@@ -0,0 +1,118 @@
+import random
+from collections.abc import Sequence
+from typing import NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from poker.constants import Rank
+from poker.rank import batch
+from poker.rank.cards import DECK
+from poker.rank.seven import MAX_CARDS
+
+# Deals generated and ranked at once, fixed so results do not depend on the number
+# of deals asked for beyond the last chunk.
+CHUNK_DEALS = 100_000
+
+
+def deal(
+    rng: np.random.Generator,
+    deals: int,
+    players: int = 1,
+    cards: int = 5,
+    dead: Sequence[int] = (),
+) -> npt.NDArray[np.uint32]:
+    """Deal random hands to each player from a shuffled deck, many deals at once.
+
+    Each deal shuffles only as much of the deck as is dealt, swapping the next card
+    of every deal with a random card after it, so hands within a deal never share a
+    card.
+
+    Arguments:
+        rng: Random number generator to shuffle with.
+        deals: Number of deals.
+        players: Number of hands per deal.
+        cards: Number of cards per hand.
+        dead: Encoded cards known to be out of the deck.
+
+    Returns:
+        Array of shape ``(deals, players, cards)`` holding encoded cards.
+
+    Raises:
+        ValueError: If there are not enough cards to deal.
+    """
+    excluded = set(dead)
+    deck = np.array([card for card in DECK if card not in excluded], dtype=np.uint32)
+    dealt = players * cards
+    if dealt > len(deck):
+        raise ValueError("Not enough cards left to deal.")
+
+    # Shuffle positions in the deck rather than cards, a byte each
+    positions = np.tile(np.arange(len(deck), dtype=np.uint8), (deals, 1))
+    rows = np.arange(deals)
+    for position in range(dealt):
+        swap = rng.integers(position, len(deck), size=deals)
+        picked = positions[rows, swap]
+        positions[rows, swap] = positions[:, position]
+        positions[:, position] = picked
+
+    return deck[positions[:, :dealt]].reshape(deals, players, cards)
+
+
+class Simulation(NamedTuple):
+    """Frequency of each rank over random deals.
+
+    Attributes:
+        seed: Seed of the deals, to reproduce them.
+        hands: Number of hands ranked, one per player per deal.
+        frequencies: Number of hands of each rank, best rank first.
+    """
+
+    seed: int
+    hands: int
+    frequencies: dict[Rank, int]
+
+
+def simulate(
+    deals: int,
+    players: int = 1,
+    cards: int = 5,
+    dead: Sequence[int] = (),
+    seed: Optional[int] = None,
+) -> Simulation:
+    """Count the ranks of the hands of random deals.
+
+    Hands of more than five cards are ranked by their best five cards. Deals are
+    generated and ranked in chunks of :data:`CHUNK_DEALS`, each with its own stream of
+    random numbers derived from the seed.
+
+    Arguments:
+        deals: Number of deals.
+        players: Number of hands per deal.
+        cards: Number of cards per hand, five to seven.
+        dead: Encoded cards known to be out of the deck.
+        seed: Seed for dealing, random if not given.
+
+    Raises:
+        ValueError: If hands do not have five to seven cards or there are not enough
+            cards to deal.
+    """
+    if not 5 <= cards <= MAX_CARDS:
+        raise ValueError(f"Hands must have five to {MAX_CARDS} cards.")
+    if seed is None:
+        seed = random.getrandbits(32)
+
+    counts = np.zeros(len(Rank) + 1, dtype=np.int64)
+    for start in range(0, deals, CHUNK_DEALS):
+        rng = np.random.default_rng([seed, start])
+        hands = deal(rng, min(CHUNK_DEALS, deals - start), players, cards, dead)
+        # The five card tables are faster where there is no best hand to choose
+        evaluate = batch.evaluate if cards == 5 else batch.evaluate_best
+        classes = evaluate(hands.reshape(-1, cards))
+        counts += np.bincount(batch.RANKS[classes], minlength=len(counts))
+
+    return Simulation(
+        seed=seed,
+        hands=deals * players,
+        frequencies={rank: int(counts[rank]) for rank in Rank},
+    )
@@ -0,0 +1,73 @@
+import random
+
+import numpy as np
+import pytest
+
+from poker.rank import batch, lookup, seven
+from poker.rank.cards import DECK
+
+
+def test_evaluate_matches_lookup() -> None:
+    rng = random.Random(0)
+    hands = [rng.sample(DECK, 5) for _ in range(20000)]
+
+    result = batch.evaluate(np.array(hands))
+
+    assert result.tolist() == [lookup.evaluate(hand) for hand in hands]
+
+
+def test_evaluate_empty() -> None:
+    assert batch.evaluate(np.empty((0, 5))).shape == (0,)
+
+
+def test_evaluate_bad_shape() -> None:
+    with pytest.raises(ValueError):
+        batch.evaluate(np.array(DECK[:4]))
+
+
+@pytest.mark.parametrize(
+    "hand",
+    [
+        5 * [DECK[0]],
+        5 * [DECK[-1]],
+        [DECK[12], DECK[25], DECK[38], DECK[51], DECK[12]],
+        [DECK[51], DECK[51], DECK[49], DECK[48], DECK[47]],
+    ],
+    ids=[
+        "five-twos",
+        "five-aces",
+        "five-aces-mixed-suits",
+        "repeated-card",
+    ],
+)
+def test_evaluate_bad_hand(hand: list[int]) -> None:
+    with pytest.raises(ValueError):
+        batch.evaluate(np.array([DECK[:5], hand]))
+
+
+@pytest.mark.parametrize("cards", [5, 6, 7])
+def test_evaluate_best_matches_seven(cards: int) -> None:
+    rng = random.Random(cards)
+    hands = [rng.sample(DECK, cards) for _ in range(5000)]
+
+    result = batch.evaluate_best(np.array(hands))
+
+    assert result.tolist() == [seven.evaluate(hand) for hand in hands]
+
+
+def test_evaluate_best_flushes() -> None:
+    royal = [DECK[index] for index in range(8, 13)]
+    hand = royal + [DECK[0], DECK[13]]
+
+    assert batch.evaluate_best(np.array([hand])).tolist() == [1]
+
+
+@pytest.mark.parametrize("cards", [4, 8])
+def test_evaluate_best_bad_shape(cards: int) -> None:
+    with pytest.raises(ValueError):
+        batch.evaluate_best(np.array([DECK[:cards]]))
+
+
+def test_evaluate_best_bad_hand() -> None:
+    with pytest.raises(ValueError):
+        batch.evaluate_best(np.array([DECK[:6], 7 * [DECK[-1]]]))
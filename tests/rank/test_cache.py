@@ -0,0 +1,44 @@
+from poker.parser import parse_hand
+from poker.rank import lookup
+from poker.rank.cache import CachedEvaluator, canonicalize
+from poker.rank.cards import suit_of
+
+
+def test_canonicalize() -> None:
+    key = canonicalize(parse_hand("AH AS KH QD 2C"))
+
+    assert canonicalize(parse_hand("KH QD AS 2C AH")) == key
+    assert canonicalize(parse_hand("AS AH KS QC 2D")) == key
+    assert canonicalize(parse_hand("AS AH KD QC 2H")) != key
+
+
+def test_cached_evaluator() -> None:
+    evaluate = CachedEvaluator(lookup.evaluate, maxsize=2)
+
+    flush = parse_hand("2H 4H 6H 8H 10H")
+    for hand in [flush, parse_hand("2S 4S 6S 8S 10S"), flush]:
+        assert evaluate(hand) == lookup.evaluate(hand)
+    assert (evaluate.hits, evaluate.misses, evaluate.evictions) == (2, 1, 0)
+
+    evaluate(parse_hand("AH AS KH QD 2C"))
+    evaluate(parse_hand("AH AS KH QD 3C"))
+    assert (evaluate.hits, evaluate.misses, evaluate.evictions) == (2, 3, 1)
+    assert len(evaluate) == 2
+
+    # The flush was least recently used so was evicted
+    evaluate(flush)
+    assert (evaluate.hits, evaluate.misses, evaluate.evictions) == (2, 4, 2)
+
+
+def test_cached_evaluator_reapplies_suit() -> None:
+    evaluate = CachedEvaluator(lookup.evaluate, maxsize=16)
+
+    for text, expected in [
+        ("AH KH QH JH 10H", "royal flush: hearts"),
+        ("AS KS QS JS 10S", "royal flush: spades"),
+        ("2C 4C 6C 8C 10C", "flush: clubs"),
+        ("2D 4D 6D 8D 10D", "flush: diamonds"),
+    ]:
+        cards = parse_hand(text)
+        assert lookup.describe(evaluate(cards), suit_of(cards[0])) == expected
+    assert evaluate.hits == 2
@@ -0,0 +1,15 @@
+from poker.constants import Suit, Value
+from poker.rank.cards import DECK, encode, suit_of, value_of
+
+
+def test_encode_round_trip() -> None:
+    for suit in Suit:
+        for value in Value:
+            card = encode(suit, value)
+
+            assert suit_of(card) == suit
+            assert value_of(card) == value
+
+
+def test_deck() -> None:
+    assert len(set(DECK)) == 52
@@ -0,0 +1,44 @@
+from collections import Counter
+
+import pytest
+
+from poker.constants import Rank
+from poker.rank.distribution import COUNTS, Standing, standing
+from poker.rank.lookup import CLASSES, HAND_CLASSES
+from poker.rank.table import HANDS
+
+
+def test_counts_by_rank() -> None:
+    totals: Counter[Rank] = Counter()
+    for index in range(1, HAND_CLASSES + 1):
+        totals[CLASSES[index].rank] += COUNTS[index]
+
+    assert sum(COUNTS) == HANDS
+    assert totals == {
+        Rank.ROYAL_FLUSH: 4,
+        Rank.STRAIGHT_FLUSH: 36,
+        Rank.FOUR_OF_A_KIND: 624,
+        Rank.FULL_HOUSE: 3744,
+        Rank.FLUSH: 5108,
+        Rank.STRAIGHT: 10200,
+        Rank.THREE_OF_A_KIND: 54912,
+        Rank.TWO_PAIR: 123552,
+        Rank.PAIR: 1098240,
+        Rank.HIGH_CARD: 1302540,
+    }
+
+
+def test_standing() -> None:
+    assert standing(1) == Standing(100 * (HANDS - 4) / HANDS, 0, 3)
+    assert standing(2) == Standing(100 * (HANDS - 8) / HANDS, 4, 3)
+    assert standing(HAND_CLASSES) == Standing(0.0, HANDS - 1020, 1019)
+
+
+def test_standing_is_monotonic() -> None:
+    standings = [standing(index) for index in range(1, HAND_CLASSES + 1)]
+
+    for stronger, weaker in zip(standings, standings[1:]):
+        assert stronger.percentile > weaker.percentile
+        assert weaker.beaten_by == stronger.beaten_by + stronger.ties + 1
+    assert standings[-1].beaten_by + standings[-1].ties + 1 == HANDS
+    assert standings[0].percentile == pytest.approx(100 * (1 - 4 / HANDS))
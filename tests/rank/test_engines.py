@@ -0,0 +1,94 @@
+from array import array
+from collections.abc import Sequence
+
+import pytest
+
+from poker.constants import Rank
+from poker.rank import engines, lookup, table
+from poker.rank.cards import DECK
+from poker.rank.engines import (
+    BatchEngine,
+    Engine,
+    LookupEngine,
+    Mismatch,
+    ReferenceEngine,
+    TableEngine,
+)
+
+# Every hand of a few thousand and the royal flushes, covering every rank
+HANDS = [
+    *list(engines.all_hands())[::997],
+    *(DECK[13 * suit + 8 : 13 * suit + 13] for suit in range(4)),
+]
+
+
+class _Broken(Engine):
+    def evaluate(self, hands: Sequence[Sequence[int]]) -> list[int]:
+        return [lookup.evaluate(cards) % 7000 + 1 for cards in hands]
+
+
+@pytest.fixture
+def hand_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    classes = array("H", bytes(2 * table.HANDS))
+    for cards in HANDS:
+        classes[table.hand_index(cards)] = lookup.evaluate(cards)
+    monkeypatch.setattr(table, "build", lambda: classes)
+    monkeypatch.delenv(engines.TABLE_ENVIRONMENT, raising=False)
+
+
+@pytest.mark.parametrize("name", ["reference", "lookup", "table", "batch"])
+def test_engines_agree(name: str, hand_table: None) -> None:
+    engine = engines.create(name)
+    expected = [lookup.evaluate(cards) for cards in HANDS]
+
+    assert {lookup.CLASSES[index].rank for index in expected} == set(Rank)
+    assert engine.evaluate(HANDS) == expected
+    assert [engine(cards) for cards in HANDS[:100]] == expected[:100]
+
+
+def test_reference_ace_low_straight() -> None:
+    five_high = [DECK[12], DECK[13], DECK[27], DECK[41], DECK[3]]
+
+    assert ReferenceEngine()(five_high) == lookup.evaluate(five_high)
+
+
+def test_create_unknown() -> None:
+    with pytest.raises(ValueError, match="Unknown engine 'fast'"):
+        engines.create("fast")
+
+
+@pytest.mark.parametrize(
+    "environment, expected",
+    [
+        ({}, LookupEngine),
+        ({engines.ENVIRONMENT: "batch"}, BatchEngine),
+        ({engines.ENVIRONMENT: "fast"}, LookupEngine),
+        ({engines.TABLE_ENVIRONMENT: "/missing/hands.tbl"}, LookupEngine),
+        ({engines.ENVIRONMENT: "table"}, TableEngine),
+    ],
+)
+def test_configured(
+    environment: dict[str, str],
+    expected: type[Engine],
+    hand_table: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(engines.ENVIRONMENT, raising=False)
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+
+    assert isinstance(engines.configured(), expected)
+
+
+def test_compare(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(engines.ENGINES, "broken", _Broken)
+
+    seconds, mismatches = engines.compare("lookup", 0, 500)
+    assert seconds > 0
+    assert mismatches == []
+
+    _, mismatches = engines.compare("broken", 2_598_000, 2_598_960)
+    assert mismatches
+    cards = mismatches[0].cards
+    expected = lookup.evaluate(cards)
+    assert mismatches[0] == Mismatch(cards, expected, expected % 7000 + 1)
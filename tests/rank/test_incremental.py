@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from poker.constants import Rank
+from poker.parser import parse_cards
+from poker.rank import lookup, seven
+from poker.rank.cards import DECK
+from poker.rank.incremental import IncrementalHand
+
+
+def test_matches_seven_card_evaluator() -> None:
+    rng = random.Random(0)
+    for _ in range(2000):
+        cards = rng.sample(DECK, 7)
+        hand = IncrementalHand()
+        for count, card in enumerate(cards, start=1):
+            hand.add(card)
+            if count >= 5:
+                index = seven.evaluate(cards[:count])
+                assert hand.hand_class == index
+                assert hand.rank == lookup.CLASSES[index].rank
+
+
+def test_flush_description() -> None:
+    hand = IncrementalHand(parse_cards("2C 4H 6H 9H 10H"))
+    assert hand.rank == Rank.HIGH_CARD
+
+    hand.add(parse_cards("KH")[0])
+    assert hand.description == "flush: hearts"
+
+    hand.add(parse_cards("KC")[0])
+    assert (hand.rank, hand.description) == (Rank.FLUSH, "flush: hearts")
+
+
+@pytest.mark.parametrize(
+    "cards,rank,description",
+    [
+        ("", None, None),
+        ("9D", Rank.HIGH_CARD, "high card: 9"),
+        ("AH AD", Rank.PAIR, "pair: ace"),
+        ("2H KD 2C KS", Rank.TWO_PAIR, "two pair: king and 2"),
+        ("7H 7D 7C", Rank.THREE_OF_A_KIND, "three of a kind: 7"),
+        ("QH QD QC QS", Rank.FOUR_OF_A_KIND, "four of a kind: queen"),
+    ],
+)
+def test_fewer_than_five_cards(cards: str, rank: Rank, description: str) -> None:
+    hand = IncrementalHand(parse_cards(cards) if cards else [])
+
+    assert (hand.rank, hand.description, hand.hand_class) == (rank, description, None)
+
+
+def test_fork() -> None:
+    flop = IncrementalHand(parse_cards("AH KH QH JD 2C"))
+    turns = {}
+    for card in DECK:
+        if card not in flop:
+            turn = flop.fork()
+            turn.add(card)
+            turns[card] = turn.hand_class
+
+    assert len(flop) == 5
+    assert flop.rank == Rank.HIGH_CARD
+    assert len(turns) == 47
+    for card, index in turns.items():
+        cards = [*parse_cards("AH KH QH JD 2C"), card]
+        assert index == seven.evaluate(cards)
+
+
+def test_counts() -> None:
+    hand = IncrementalHand(parse_cards("2H 2D AS"))
+
+    assert hand.counts == [2] + [0] * 11 + [1]
+
+
+def test_invalid_cards() -> None:
+    hand = IncrementalHand(parse_cards("AH KH QH JH 10H 9H 8H"))
+
+    with pytest.raises(ValueError, match="Hand cannot have more than 7 cards."):
+        hand.add(parse_cards("2C")[0])
+    with pytest.raises(ValueError, match="Hand contains duplicate card: 'AH'."):
+        IncrementalHand(parse_cards("AH KH")).add(parse_cards("AH")[0])
+
+
+def test_extend_adds_all_or_nothing() -> None:
+    hand = IncrementalHand(parse_cards("AH KH"))
+
+    with pytest.raises(ValueError, match="Hand contains duplicate card: 'QH'."):
+        hand.extend(parse_cards("QH JH") + parse_cards("QH"))
+
+    assert len(hand) == 2
+    assert hand.description == "high card: ace"
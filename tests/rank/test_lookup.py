@@ -0,0 +1,76 @@
+import random
+from collections import Counter
+from itertools import cycle
+
+from poker.constants import Rank, Suit, Value
+from poker.models import Card, Hand
+from poker.rank import hands, lookup
+from poker.rank.cards import DECK, encode, suit_of, value_of
+
+SUITS = [Suit.CLUBS, Suit.DIAMONDS, Suit.HEARTS, Suit.SPADES]
+
+
+def _hand(cards: list[int]) -> Hand:
+    return Hand(
+        cards=[Card(suit=suit_of(card), value=value_of(card)) for card in cards]
+    )
+
+
+def test_classes() -> None:
+    counts = Counter(hand_class.rank for hand_class in lookup.CLASSES[1:])
+
+    assert len(lookup.CLASSES) == lookup.HAND_CLASSES + 1
+    assert counts == {
+        Rank.ROYAL_FLUSH: 1,
+        Rank.STRAIGHT_FLUSH: 9,
+        Rank.FOUR_OF_A_KIND: 156,
+        Rank.FULL_HOUSE: 156,
+        Rank.FLUSH: 1277,
+        Rank.STRAIGHT: 10,
+        Rank.THREE_OF_A_KIND: 858,
+        Rank.TWO_PAIR: 858,
+        Rank.PAIR: 2860,
+        Rank.HIGH_CARD: 1277,
+    }
+
+
+def test_rank_hand_matches_reference() -> None:
+    for (index, hand_class), suit in zip(
+        enumerate(lookup.CLASSES[1:], start=1), cycle(SUITS)
+    ):
+        if hand_class.rank in (Rank.ROYAL_FLUSH, Rank.STRAIGHT_FLUSH, Rank.FLUSH):
+            suits = [suit] * 5
+        else:
+            suits = [suit, *(s for s in SUITS if s != suit), suit]
+        hand = _hand([encode(s, v) for s, v in zip(suits, hand_class.values)])
+
+        assert lookup.evaluate([encode(c.suit, c.value) for c in hand.cards]) == index
+        assert lookup.rank_hand(hand) == hands.rank_hand(hand)
+
+
+def test_rank_hand_matches_reference_random() -> None:
+    rng = random.Random(0)
+    for _ in range(2000):
+        hand = _hand(rng.sample(DECK, 5))
+
+        assert lookup.rank_hand(hand) == hands.rank_hand(hand)
+
+
+def test_evaluate_orders_hands() -> None:
+    def evaluate(values: list[int]) -> int:
+        return lookup.evaluate(
+            [encode(suit, Value(value)) for suit, value in zip(cycle(SUITS), values)]
+        )
+
+    assert (
+        evaluate([2, 3, 4, 5, 6])
+        < evaluate([14, 2, 3, 4, 5])
+        < evaluate([14, 14, 13, 12, 11])
+        < evaluate([2, 2, 14, 13, 12])
+        < evaluate([14, 13, 12, 11, 9])
+    )
+
+
+def test_strength() -> None:
+    assert lookup.strength(1) == lookup.HAND_CLASSES
+    assert lookup.strength(lookup.HAND_CLASSES) == 1
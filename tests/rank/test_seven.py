@@ -0,0 +1,30 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from poker.rank import lookup, seven
+from poker.rank.cards import DECK
+
+
+@pytest.mark.parametrize("count", [5, 6, 7])
+def test_evaluate_matches_best_of_combinations(count: int) -> None:
+    rng = random.Random(count)
+    for _ in range(2000):
+        cards = rng.sample(DECK, count)
+
+        assert seven.evaluate(cards) == min(
+            lookup.evaluate(five) for five in combinations(cards, 5)
+        )
+
+
+def test_best_five() -> None:
+    rng = random.Random(0)
+    for _ in range(2000):
+        cards = rng.sample(DECK, 7)
+
+        index, five = seven.best_five(cards)
+
+        assert len(set(five)) == 5
+        assert set(five) <= set(cards)
+        assert lookup.evaluate(five) == index
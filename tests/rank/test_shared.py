@@ -0,0 +1,127 @@
+import json
+import mmap
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from poker.rank import lookup, seven, shared
+from poker.rank.cards import DECK
+from poker.rank.shared import SharedTables
+
+HANDS = """
+import json, random, sys
+from poker.rank import lookup, seven
+from poker.rank.cards import DECK
+rng = random.Random(0)
+hands = [rng.sample(DECK, 7) for _ in range(5000)]
+json.dump(
+    {
+        "shared": lookup._SHARED is not None and seven._SHARED is not None,
+        "five": [lookup.evaluate(hand[:5]) for hand in hands],
+        "seven": [seven.evaluate(hand) for hand in hands],
+    },
+    sys.stdout,
+)
+"""
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("shared") / "tables"
+    with open(path, "wb") as file:
+        shared.write(file, *lookup.tables(), *seven.tables())
+    return path
+
+
+def test_shared_tables(path: Path) -> None:
+    tables = SharedTables(str(path))
+
+    flushes, unique5, products = lookup.tables()
+    flush_best, product_best = seven.tables()
+    assert list(tables.flushes) == list(flushes)
+    assert list(tables.unique5) == list(unique5)
+    assert list(tables.flush_best) == list(flush_best)
+    assert dict(tables.products) == dict(products)
+    assert dict(tables.product_best) == dict(product_best)
+
+    with pytest.raises(KeyError):
+        tables.products[2**5]
+
+
+def test_shared_tables_close(path: Path) -> None:
+    tables = SharedTables(str(path))
+
+    tables.close()
+
+    with pytest.raises(ValueError):
+        tables.flushes[0]
+
+
+@pytest.mark.parametrize(
+    "offset,value,message",
+    [
+        (0, b"XXXX", "does not hold"),
+        (4, b"\x00", "stale"),
+        (100, b"\xff", "checksum"),
+    ],
+    ids=["magic", "version", "checksum"],
+)
+def test_shared_tables_invalid(
+    path: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    offset: int,
+    value: bytes,
+    message: str,
+) -> None:
+    data = bytearray(path.read_bytes())
+    data[offset : offset + len(value)] = value
+    invalid = tmp_path / "invalid"
+    invalid.write_bytes(data)
+    map_type, maps = mmap.mmap, []
+
+    def track(*args: Any, **kwargs: Any) -> mmap.mmap:
+        maps.append(map_type(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(mmap, "mmap", track)
+
+    with pytest.raises(ValueError, match=message):
+        SharedTables(str(invalid))
+    assert maps[0].closed
+
+
+@pytest.mark.parametrize("configured", [False, True])
+def test_attach_falls_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, configured: bool
+) -> None:
+    if configured:
+        monkeypatch.setenv(shared.ENVIRONMENT, str(tmp_path / "missing"))
+    else:
+        monkeypatch.delenv(shared.ENVIRONMENT, raising=False)
+    shared.attach.cache_clear()
+
+    assert shared.attach() is None
+
+    shared.attach.cache_clear()
+
+
+def test_worker_evaluates_with_shared_tables(path: Path) -> None:
+    output = subprocess.run(
+        [sys.executable, "-c", HANDS],
+        env={**os.environ, shared.ENVIRONMENT: str(path)},
+        capture_output=True,
+        check=True,
+    ).stdout
+    result = json.loads(output)
+
+    rng = random.Random(0)
+    hands = [rng.sample(DECK, 7) for _ in range(5000)]
+    assert result["shared"]
+    assert result["five"] == [lookup.evaluate(hand[:5]) for hand in hands]
+    assert result["seven"] == [seven.evaluate(hand) for hand in hands]
@@ -0,0 +1,76 @@
+import random
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from poker.rank import lookup, table
+from poker.rank.cards import DECK
+from poker.rank.table import HANDS, HandTable, hand_index
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("table") / "hands.tbl"
+    with open(path, "wb") as file:
+        table.write(file, table.build())
+    return path
+
+
+def test_hand_index() -> None:
+    assert hand_index(DECK[:5]) == 0
+    assert hand_index(DECK[-5:]) == HANDS - 1
+    assert hand_index(list(reversed(DECK[:5]))) == 0
+
+    indices = {hand_index(cards) for cards in combinations(DECK[:12], 5)}
+    assert indices == set(range(len(indices)))
+
+
+def test_hand_table(path: Path) -> None:
+    hand_table = HandTable(str(path))
+
+    cards = list(DECK)
+    rng = random.Random(0)
+    for _ in range(10_000):
+        rng.shuffle(cards)
+        assert hand_table(cards[:5]) == lookup.evaluate(cards[:5])
+
+    hand_table.close()
+
+
+@pytest.mark.parametrize(
+    "offset,value,message",
+    [
+        (0, b"XXXX", "not a hand table"),
+        (4, b"\x00", "stale"),
+        (100, b"\xff", "checksum"),
+    ],
+    ids=["magic", "version", "checksum"],
+)
+def test_hand_table_invalid(
+    path: Path, tmp_path: Path, offset: int, value: bytes, message: str
+) -> None:
+    data = bytearray(path.read_bytes())
+    data[offset : offset + len(value)] = value
+    invalid = tmp_path / "invalid.tbl"
+    invalid.write_bytes(data)
+
+    with pytest.raises(ValueError, match=message):
+        HandTable(str(invalid))
+
+
+def test_hand_table_truncated(path: Path, tmp_path: Path) -> None:
+    truncated = tmp_path / "truncated.tbl"
+    truncated.write_bytes(path.read_bytes()[:-2])
+
+    with pytest.raises(ValueError, match="checksum"):
+        HandTable(str(truncated))
+
+    truncated.write_bytes(b"PK")
+    with pytest.raises(ValueError, match="truncated"):
+        HandTable(str(truncated))
+
+
+def test_hand_table_missing(tmp_path: Path) -> None:
+    with pytest.raises(OSError):
+        HandTable(str(tmp_path / "missing.tbl"))
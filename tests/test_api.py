@@ -1,7 +1,24 @@
+import asyncio
+import json
+import time
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+from unittest.mock import ANY
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from poker import api
 from poker.api import app
+from poker.batching import MicroBatcher
+from poker.constants import JobStatus, Rank
+from poker.jobs import Jobs
+from poker.models import MAX_TRIALS, Job
+from poker.rank import lookup
+from poker.rank.cache import CachedEvaluator
 
 
 @pytest.fixture(scope="function")
@@ -16,6 +33,38 @@ def test_health_check(client: TestClient) -> None:
     assert response.json() == "OK"
 
 
+def test_ready_before_warm_up(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(api, "_WARM_UP_SECONDS", None)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json() == {"ready": False, "warm_up_seconds": None}
+
+
+@pytest.mark.timeout(10)
+def test_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "_WARM_UP_SECONDS", None)
+
+    with TestClient(app) as client:
+        while (response := client.get("/ready")).status_code == 503:
+            time.sleep(0.01)
+
+    assert response.status_code == 200
+    assert response.json() == {"ready": True, "warm_up_seconds": ANY}
+    assert response.json()["warm_up_seconds"] > 0
+
+
+def test_warm_up_hands() -> None:
+    hands = api._warm_up_hands()
+
+    assert list(hands) == list(Rank)
+    for hand_rank, cards in hands.items():
+        assert lookup.rank_cards(cards)[0] == hand_rank
+
+
 @pytest.mark.parametrize(
     "body,expected",
     [
@@ -50,18 +99,658 @@ def test_rank(client: TestClient, body: str, expected: str) -> None:
     assert response.json() == expected
 
 
+def test_rank_cached(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    evaluate = CachedEvaluator(lookup.evaluate, maxsize=16)
+    monkeypatch.setattr(api, "_evaluate", evaluate)
+
+    for body, expected in [
+        ("KC 10C 8C 7C 5C", "flush: clubs"),
+        ("KH 10H 8H 7H 5H", "flush: hearts"),
+    ]:
+        response = client.post("/rank", json=body)
+
+        assert response.status_code == 200
+        assert response.json() == expected
+    assert (evaluate.hits, evaluate.misses) == (1, 1)
+
+
 @pytest.mark.parametrize(
     "body",
     [
         "AH KH QH JH",
         "AH KH QH JH 99W",
+        "AH KH QH JH AH",
     ],
     ids=[
         "too-few",
         "not-a-card",
+        "duplicate",
     ],
 )
 def test_rank_bad_input(client: TestClient, body: str) -> None:
     response = client.post("/rank", json=body)
 
-    assert response.status_code != 200
+    assert response.status_code == 422
+
+
+def test_rank_bad_input_names_card(client: TestClient) -> None:
+    response = client.post("/rank", json="AH KH QH JH 99W")
+
+    assert response.json() == {"detail": "Invalid card: '99W'."}
+
+
+def test_rank_alternative_notation(client: TestClient) -> None:
+    response = client.post("/rank", json="ah k♥ Qh J♡ TH")
+
+    assert response.status_code == 200
+    assert response.json() == "royal flush: hearts"
+
+
+def test_get_rank(client: TestClient) -> None:
+    response = client.get("/rank/AH-KH-QH-JH-10H")
+
+    assert response.status_code == 200
+    assert response.json() == "royal flush: hearts"
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    assert client.get("/rank/AH-KH-QH-JH-10H").headers["etag"] == etag
+    assert client.get("/rank/AS-KS-QS-JS-10S").headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/rank/10H-JH-QH-KH-AH",
+        "/rank/ah-kh-qh-jh-th",
+        "/rank/AH,KH,QH,JH,10H",
+        "/rank/AH KH QH JH 10H",
+        "/rank/A%E2%99%A5-KH-QH-JH-10H",
+    ],
+    ids=["order", "notation", "commas", "spaces", "glyph"],
+)
+def test_get_rank_redirects_to_canonical(client: TestClient, path: str) -> None:
+    response = client.get(path, follow_redirects=False)
+
+    assert response.status_code == 308
+    assert response.headers["location"] == "http://testserver/rank/AH-KH-QH-JH-10H"
+    assert "max-age" in response.headers["cache-control"]
+
+
+def test_get_rank_orders_suits(client: TestClient) -> None:
+    response = client.get("/rank/2S-2C-3D-3H-4S", follow_redirects=False)
+
+    assert response.headers["location"].endswith("/rank/4S-3D-3H-2C-2S")
+
+
+@pytest.mark.parametrize(
+    "if_none_match,status",
+    [
+        ("{etag}", 304),
+        ("W/{etag}", 304),
+        ('"other", {etag}', 304),
+        ("*", 304),
+        ('"other"', 200),
+    ],
+)
+def test_get_rank_not_modified(
+    client: TestClient, if_none_match: str, status: int
+) -> None:
+    etag = client.get("/rank/AH-KH-QH-JH-10H").headers["etag"]
+
+    response = client.get(
+        "/rank/AH-KH-QH-JH-10H",
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+
+    assert response.status_code == status
+    assert response.headers["etag"] == etag
+    if status == 304:
+        assert not response.content
+
+
+def test_get_rank_bad_input(client: TestClient) -> None:
+    response = client.get("/rank/AH-KH-QH-JH-99W")
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Invalid card: '99W'."}
+    assert "cache-control" not in response.headers
+
+
+def test_rank_websocket(client: TestClient) -> None:
+    with client.websocket_connect("/rank/ws") as websocket:
+        # Pipeline several messages before reading any replies
+        websocket.send_json({"id": 1, "hand": "AH KH QH JH 10H"})
+        websocket.send_json({"id": "two", "hands": ["AH AC KD KS 7H", "AH KH"]})
+        websocket.send_json({"id": 3, "hand": "AH KH QH JH 99W"})
+        websocket.send_bytes(b'{"id": 4, "hand": "AH KC QD 9S 7H"}')
+        replies = [websocket.receive_json() for _ in range(4)]
+
+    assert sorted(replies, key=lambda reply: str(reply["id"])) == [
+        {"id": 1, "description": "royal flush: hearts"},
+        {"id": 3, "error": "Invalid card: '99W'."},
+        {"id": 4, "description": "high card: ace"},
+        {
+            "id": "two",
+            "results": [
+                {"description": "two pair: ace and king"},
+                {"error": "Hand must have five cards."},
+            ],
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "message,reply",
+    [
+        ("not json", {"id": None, "error": "Message is not JSON."}),
+        ("[1]", {"id": None, "error": "Message must be an object."}),
+        (
+            '{"id": 5}',
+            {"id": 5, "error": "Message must have a hand or a list of hands."},
+        ),
+        ('{"id": 6, "hand": 7}', {"id": 6, "error": "Hand must be a string."}),
+        (
+            '{"id": 7, "hands": [7]}',
+            {"id": 7, "results": [{"error": "Hand must be a string."}]},
+        ),
+    ],
+    ids=["not-json", "not-object", "no-hand", "hand-not-string", "hands-not-strings"],
+)
+def test_rank_websocket_bad_message(
+    client: TestClient, message: str, reply: dict[str, object]
+) -> None:
+    with client.websocket_connect("/rank/ws") as websocket:
+        websocket.send_text(message)
+
+        assert websocket.receive_json() == reply
+
+
+@pytest.mark.timeout(10)
+def test_rank_websocket_in_flight_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    # With one message in flight, each is read only after the last was answered
+    monkeypatch.setattr(api, "_WS_MAX_IN_FLIGHT", 1)
+    batcher = MicroBatcher(api._evaluate_batch, window=0.01, max_size=256)
+    monkeypatch.setattr(api, "_BATCHER", batcher)
+
+    with TestClient(app).websocket_connect("/rank/ws") as websocket:
+        for index in range(3):
+            websocket.send_json({"id": index, "hand": "AH KH QH JH 10H"})
+        replies = [websocket.receive_json()["id"] for _ in range(3)]
+
+    assert replies == [0, 1, 2]
+    assert batcher.batches == 3
+
+
+def test_rank_micro_batched(monkeypatch: pytest.MonkeyPatch) -> None:
+    batcher = MicroBatcher(api._evaluate_batch, window=0.05, max_size=8)
+    monkeypatch.setattr(api, "_BATCHER", batcher)
+    bodies = ["AH KH QH JH 10H", "AH AC KD KS 7H", "AH KC QD 9S 7H"] * 4
+
+    async def main() -> list[httpx.Response]:
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.post("/rank", json=body) for body in bodies)
+            )
+
+    responses = asyncio.run(main())
+
+    assert [response.json() for response in responses] == [
+        "royal flush: hearts",
+        "two pair: ace and king",
+        "high card: ace",
+    ] * 4
+    assert batcher.hands == len(bodies)
+    assert batcher.batches < len(bodies)
+
+
+def test_metrics(client: TestClient) -> None:
+    client.post("/rank", json="AH KH QH JH 10H")
+    client.post("/rank", json="AH KH QH JH 10X")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'poker_requests_total{route="/rank",method="POST",status="200"}' in text
+    assert 'poker_requests_total{route="/rank",method="POST",status="422"}' in text
+    assert 'poker_ranks_total{rank="Royal Flush"}' in text
+    for stage in ["parse", "evaluate", "describe", "serialize"]:
+        assert f'poker_rank_stage_duration_seconds_count{{stage="{stage}"}}' in text
+    assert 'poker_request_duration_seconds_count{route="/rank"}' in text
+
+
+def test_rank_batch(client: TestClient) -> None:
+    hands = ["AH KH QH JH 10H", "2H 4D 4S 2C 4H", "AH KC QD 9S 7H"]
+    expected = ["royal flush: hearts", "full house: 4 over 2", "high card: ace"]
+
+    response = client.post("/rank/batch", json=hands)
+
+    assert response.status_code == 200
+    assert response.json() == expected
+
+    response = client.post(
+        "/rank/batch",
+        content="\n".join(hands) + "\n",
+        headers={"content-type": "text/plain"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+def test_rank_ranking_json(client: TestClient) -> None:
+    response = client.post(
+        "/rank",
+        json="AH KH QH JH 10H",
+        headers={"Accept": "application/vnd.poker.ranking+json"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.poker.ranking+json"
+    assert response.json() == {
+        "rank": Rank.ROYAL_FLUSH,
+        "strength": 7462,
+        "description": "royal flush: hearts",
+    }
+
+
+@pytest.mark.parametrize(
+    "accept,content_type",
+    [
+        ("*/*", "application/json"),
+        ("application/*", "application/json"),
+        (
+            "text/html, application/vnd.poker.ranking+json",
+            "application/vnd.poker.ranking+json",
+        ),
+        (
+            "application/json;q=0.5, application/vnd.poker.ranking+json",
+            "application/vnd.poker.ranking+json",
+        ),
+        (
+            "application/vnd.poker.ranking+json;q=0, */*;q=0.1",
+            "application/json",
+        ),
+    ],
+)
+def test_rank_negotiation(client: TestClient, accept: str, content_type: str) -> None:
+    response = client.post("/rank", json="AH KH QH JH 10H", headers={"Accept": accept})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(content_type)
+
+
+@pytest.mark.parametrize("path", ["/rank", "/rank/batch"])
+@pytest.mark.parametrize("accept", ["text/plain", "application/xml"])
+def test_rank_not_acceptable(client: TestClient, path: str, accept: str) -> None:
+    response = client.post(path, json="AH KH QH JH 10H", headers={"Accept": accept})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_rank_percentile(client: TestClient) -> None:
+    response = client.post("/rank?percentile=true", json="AH KH QH JH 10H")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "description": "royal flush: hearts",
+        "percentile": pytest.approx(100 * (1 - 4 / 2598960)),
+        "beaten_by": 0,
+        "ties": 3,
+    }
+
+
+def test_rank_percentile_ranking_json(client: TestClient) -> None:
+    response = client.post(
+        "/rank?percentile=true",
+        json="2C 3D 4H 5S 7C",
+        headers={"Accept": "application/vnd.poker.ranking+json"},
+    )
+
+    assert response.headers["content-type"] == "application/vnd.poker.ranking+json"
+    assert response.json() == {
+        "rank": 10,
+        "strength": 1,
+        "description": "high card: 7",
+        "percentile": 0.0,
+        "beaten_by": 2598960 - 1020,
+        "ties": 1019,
+    }
+
+
+def test_rank_batch_ranking_formats(client: TestClient) -> None:
+    hands = ["AH KH QH JH 10H", "AH AC KD KS 7H", "7H 5C 4D 3S 2H"]
+
+    response = client.post(
+        "/rank/batch",
+        json=hands,
+        headers={"Accept": "application/vnd.poker.ranking+json"},
+    )
+
+    assert [ranking["rank"] for ranking in response.json()] == [
+        Rank.ROYAL_FLUSH,
+        Rank.TWO_PAIR,
+        Rank.HIGH_CARD,
+    ]
+    strengths = [ranking["strength"] for ranking in response.json()]
+    assert strengths[0] == 7462 and strengths[2] == 1
+
+    response = client.post(
+        "/rank/batch", json=hands, headers={"Accept": "application/vnd.poker.ranking"}
+    )
+
+    assert response.headers["content-type"] == "application/vnd.poker.ranking"
+    assert list(array("H", response.content)) == [
+        Rank.ROYAL_FLUSH,
+        7462,
+        Rank.TWO_PAIR,
+        strengths[1],
+        Rank.HIGH_CARD,
+        1,
+    ]
+
+
+def test_rank_batch_empty(client: TestClient) -> None:
+    response = client.post("/rank/batch", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.parametrize(
+    "hands",
+    [
+        ["AH KH QH JH 10H", "AH KH QH JH"],
+        ["AH KH QH JH 10H", "AH KH QH JH 99W"],
+        ["AH KH QH JH 10H", "AH KH QH JH AH"],
+    ],
+    ids=[
+        "too-few",
+        "not-a-card",
+        "duplicate",
+    ],
+)
+def test_rank_batch_bad_input(client: TestClient, hands: list[str]) -> None:
+    response = client.post("/rank/batch", json=hands)
+
+    assert response.status_code == 422
+    assert "index 1" in response.json()["detail"]
+
+
+@pytest.mark.timeout(10)
+def test_rank_stream(client: TestClient) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'AH KH QH JH 10H\n"2H 4D 4S'
+        yield b' 2C 4H"\n\n{"hand": "AH KH QH JH"}\n\xff\n'
+        yield b"AH KC QD 9S 7H"
+
+    response = client.post("/rank/stream", content=body())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"description": "royal flush: hearts"},
+        {"description": "full house: 4 over 2"},
+        {"error": "Hand must have five cards."},
+        {"error": ANY},
+        {"description": "high card: ace"},
+    ]
+
+
+@pytest.mark.timeout(10)
+def test_rank_stream_line_too_long(client: TestClient) -> None:
+    def body() -> Iterator[bytes]:
+        yield b"AH KH QH JH 10H\n" + 40 * 1024 * b"A"
+        yield 40 * 1024 * b"A"
+        yield 40 * 1024 * b"A"
+        yield b"\nAH KC QD 9S 7H\n"
+
+    response = client.post("/rank/stream", content=body())
+
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"description": "royal flush: hearts"},
+        {"error": "Line too long."},
+        {"description": "high card: ace"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "body,cards,expected",
+    [
+        (
+            "AH KD 2H 3D 5S 10C KC",
+            ["KD", "KC", "AH", "10C", "5S"],
+            "pair: king",
+        ),
+        (
+            "AH 2D 2H 3H 4H 5H 9C",
+            ["5H", "4H", "3H", "2H", "AH"],
+            "straight flush: 5-high hearts",
+        ),
+        (
+            "9S 9D 9H 2C 2D 2H 9C",
+            ["9S", "9D", "9H", "9C", "2C"],
+            "four of a kind: 9",
+        ),
+    ],
+    ids=[
+        "pair",
+        "straight-flush",
+        "four-of-a-kind",
+    ],
+)
+def test_rank_seven(
+    client: TestClient, body: str, cards: list[str], expected: str
+) -> None:
+    response = client.post("/rank/seven", json=body)
+
+    assert response.status_code == 200
+    assert response.json() == {"cards": cards, "description": expected}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "AH KD 2H 3D 5S",
+        "AH KD 2H 3D 5S 10C 99W",
+        "AH KD 2H 3D 5S 10C AH",
+    ],
+    ids=[
+        "too-few",
+        "not-a-card",
+        "duplicate",
+    ],
+)
+def test_rank_seven_bad_input(client: TestClient, body: str) -> None:
+    response = client.post("/rank/seven", json=body)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "hands,winners",
+    [
+        (["AH AC KD KS 7H", "AD AS KH KC 9H"], [1]),
+        (["AH AC KD KS 7H", "AD AS KH KC 7C"], [0, 1]),
+        (["2H 2C 3D 3S 4H", "AD KS QH JC 9H", "5C 6C 7C 8C 9D"], [2]),
+        (["AH KH", "2C 2D"], None),
+        (["AH KH 2S 3S 4D 5C 9H", "2C 2D 2S 3S 4D 5C 9H"], [0]),
+    ],
+    ids=[
+        "kicker",
+        "tie",
+        "three-hands",
+        "too-few-cards",
+        "seven-cards",
+    ],
+)
+def test_showdown(
+    client: TestClient, hands: list[str], winners: Optional[list[int]]
+) -> None:
+    response = client.post("/showdown", json=hands)
+
+    if winners is None:
+        assert response.status_code == 422
+    else:
+        assert response.status_code == 200
+        assert response.json()["winners"] == winners
+        assert len(response.json()["descriptions"]) == len(hands)
+
+
+def test_showdown_single_hand(client: TestClient) -> None:
+    response = client.post("/showdown", json=["AH AC KD KS 7H"])
+
+    assert response.status_code == 422
+
+
+def test_equity(client: TestClient) -> None:
+    response = client.post(
+        "/equity", json={"hands": ["AH AC", "KD KS"], "board": "2C 7D 9H", "dead": "3S"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["exact"]
+    assert response.json()["trials"] == 946
+    assert len(response.json()["players"]) == 2
+
+
+def test_equity_sampled(client: TestClient) -> None:
+    body = {"hands": ["AH AC", "KD KS"], "trials": 1000, "seed": 7}
+
+    response = client.post("/equity", json=body)
+
+    assert response.status_code == 200
+    assert not response.json()["exact"]
+    assert response.json() == client.post("/equity", json=body).json()
+
+
+def test_equity_bad_input(client: TestClient) -> None:
+    response = client.post("/equity", json={"hands": ["AH AC", "AH KS"]})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("trials", [0, MAX_TRIALS + 1])
+def test_equity_bad_trials(client: TestClient, trials: int) -> None:
+    response = client.post(
+        "/equity", json={"hands": ["AH AC", "KD KS"], "trials": trials}
+    )
+
+    assert response.status_code == 422
+
+
+def test_outs(client: TestClient) -> None:
+    response = client.post("/outs", json={"cards": "AH KH QH 2C", "dead": "JH"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["rank"], body["description"]) == (10, "high card: ace")
+    assert len(body["cards"]) == 47
+    assert body["cards"][0] == {
+        "card": "3C",
+        "rank": 10,
+        "description": "high card: ace",
+        "improves": False,
+    }
+    assert body["ranks"] == [{"rank": 9, "outs": 12, "probability": 12 / 47}]
+    assert (body["outs"], body["probability"]) == (12, 12 / 47)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [{"cards": "AH KH QH"}, {"cards": "AH KH QH 2C", "dead": "AH"}, {"cards": "XX"}],
+)
+def test_outs_bad_input(client: TestClient, body: dict[str, str]) -> None:
+    response = client.post("/outs", json=body)
+
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Jobs:
+    jobs = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+    monkeypatch.setattr(api, "_JOBS", jobs)
+    return jobs
+
+
+def _wait_for_job(client: TestClient, location: str) -> dict[str, object]:
+    for _ in range(500):
+        job: dict[str, object] = client.get(location).json()
+        if job["status"] != "queued" and job["status"] != "running":
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(location)
+
+
+def test_job(client: TestClient, jobs: Jobs) -> None:
+    body = "AH KH QH JH 10H\n2C 3D 5H 7S 9C\nAH AH"
+    response = client.post(
+        "/jobs", content=body, headers={"content-type": "text/plain"}
+    )
+
+    assert response.status_code == 202
+    assert response.json()["lines"] == 3
+    location = response.headers["location"]
+    job = _wait_for_job(client, location)
+    assert job == {
+        "job_id": ANY,
+        "status": "done",
+        "lines": 3,
+        "chunk_size": 2,
+        "chunks": 2,
+        "completed_chunks": 2,
+        "error": None,
+    }
+
+    chunk = client.get(f"{location}/chunks/1")
+    assert chunk.status_code == 200
+    assert chunk.text == '{"error": "Hand contains duplicate card: \'AH\'."}\n'
+    assert client.get(f"{location}/chunks/2").status_code == 404
+
+    results = client.get(f"{location}/results")
+    assert results.status_code == 200
+    assert results.headers["accept-ranges"] == "bytes"
+    lines = [json.loads(line) for line in results.text.splitlines()]
+    assert lines == [
+        {"description": "royal flush: hearts"},
+        {"description": "high card: 9"},
+        {"error": "Hand contains duplicate card: 'AH'."},
+    ]
+
+    resumed = client.get(f"{location}/results", headers={"range": "bytes=10-"})
+    assert resumed.status_code == 206
+    assert resumed.content == results.content[10:]
+    size = len(results.content)
+    assert resumed.headers["content-range"] == f"bytes 10-{size - 1}/{size}"
+
+    part = client.get(f"{location}/results", headers={"range": "bytes=2-5"})
+    assert (part.status_code, part.content) == (206, results.content[2:6])
+
+    beyond = client.get(f"{location}/results", headers={"range": f"bytes={size}-"})
+    assert beyond.status_code == 416
+
+    backwards = client.get(f"{location}/results", headers={"range": "bytes=10-2"})
+    assert backwards.status_code == 416
+    assert backwards.headers["content-range"] == f"bytes */{size}"
+
+
+def test_job_not_found(client: TestClient, jobs: Jobs) -> None:
+    assert client.get(f"/jobs/{'0' * 32}").status_code == 404
+    assert client.get("/jobs/bad/results").status_code == 404
+
+
+def test_job_results_before_done(client: TestClient, jobs: Jobs) -> None:
+    job_id = jobs.new()
+    job = Job(job_id=job_id, status=JobStatus.RUNNING, lines=1, chunk_size=2, chunks=1)
+    (Path(jobs.directory) / job_id / "job.json").write_text(job.json())
+
+    response = client.get(f"/jobs/{job_id}/results")
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Job is running."
+    assert client.get(f"/jobs/{job_id}/chunks/0").status_code == 404
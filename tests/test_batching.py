@@ -0,0 +1,70 @@
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from poker.batching import MicroBatcher
+
+
+def _evaluate(hands: Sequence[Sequence[int]]) -> list[int]:
+    return [sum(hand) for hand in hands]
+
+
+def test_batches_concurrent_hands() -> None:
+    sizes: list[int] = []
+    batcher = MicroBatcher(_evaluate, window=0.01, max_size=4, on_batch=sizes.append)
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(batcher.evaluate([i, i]) for i in range(10)))
+
+    assert asyncio.run(main()) == [2 * i for i in range(10)]
+    assert sizes == [4, 4, 2]
+    assert (batcher.batches, batcher.hands, len(batcher)) == (3, 10, 0)
+
+
+def test_window_bounds_wait() -> None:
+    batcher = MicroBatcher(_evaluate, window=0.001, max_size=256)
+
+    async def main() -> int:
+        return await asyncio.wait_for(batcher.evaluate([1, 2]), timeout=1)
+
+    assert asyncio.run(main()) == 3
+    assert batcher.batches == 1
+
+
+def test_error_reaches_every_caller() -> None:
+    def evaluate(hands: Sequence[Sequence[int]]) -> list[int]:
+        raise ValueError("Bad batch.")
+
+    batcher = MicroBatcher(evaluate, window=0.001, max_size=256)
+
+    async def main() -> list[object]:
+        return list(
+            await asyncio.gather(
+                batcher.evaluate([1]), batcher.evaluate([2]), return_exceptions=True
+            )
+        )
+
+    results = asyncio.run(main())
+    assert len(results) == 2
+    for result in results:
+        assert isinstance(result, ValueError)
+
+
+def test_empty_flush() -> None:
+    batcher = MicroBatcher(_evaluate, window=0.001, max_size=1)
+
+    batcher._flush()
+
+    assert batcher.batches == 0
+
+
+@pytest.mark.parametrize("max_size", [1, 2])
+def test_full_batch_flushes_immediately(max_size: int) -> None:
+    batcher = MicroBatcher(_evaluate, window=60, max_size=max_size)
+
+    async def main() -> list[int]:
+        hands = [batcher.evaluate([i]) for i in range(max_size)]
+        return await asyncio.wait_for(asyncio.gather(*hands), timeout=1)
+
+    assert asyncio.run(main()) == list(range(max_size))
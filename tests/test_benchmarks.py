@@ -0,0 +1,21 @@
+from benchmarks.run import compare
+
+
+def test_compare_reports_slower_timings() -> None:
+    baseline = {"rank": {"ns_per_call": 100.0}}
+    assert compare(baseline, {"rank": {"ns_per_call": 109.0}}, 0.1) == []
+    assert compare(baseline, {"rank": {"ns_per_call": 120.0}}, 0.1) == [
+        "rank ns_per_call: 100 -> 120"
+    ]
+
+
+def test_compare_reports_lower_throughput() -> None:
+    baseline = {"http": {"requests_per_second": 1000.0}}
+    assert compare(baseline, {"http": {"requests_per_second": 2000.0}}, 0.1) == []
+    assert compare(baseline, {"http": {"requests_per_second": 800.0}}, 0.1) == [
+        "http requests_per_second: 1000 -> 800"
+    ]
+
+
+def test_compare_ignores_new_benchmarks() -> None:
+    assert compare({}, {"new": {"ns_per_call": 1.0}}, 0.1) == []
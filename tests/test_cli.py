@@ -0,0 +1,122 @@
+import io
+import json
+import os
+from array import array
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+import uvicorn
+
+from poker.cli import main
+from poker.rank import lookup, shared, table
+from poker.rank.shared import SharedTables
+
+HANDS = [
+    "AH KH QH JH 10H",
+    '"2H 4D 4S 2C 4H"',
+    "",
+    '{"hand": "AH KH QH JH"}',
+    "AH KC QD 9S 7H",
+]
+EXPECTED = [
+    {"description": "royal flush: hearts"},
+    {"description": "full house: 4 over 2"},
+    {"error": "Hand must have five cards."},
+    {"description": "high card: ace"},
+]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_rank(tmp_path: Path, workers: str) -> None:
+    first, second = tmp_path / "first.jsonl", tmp_path / "second.txt"
+    first.write_text("\n".join(HANDS) + "\n")
+    second.write_text("\n".join(HANDS))
+    output = tmp_path / "output.jsonl"
+
+    main(
+        [
+            "rank",
+            str(first),
+            str(second),
+            "--output",
+            str(output),
+            "--chunk-size",
+            "2",
+            "--workers",
+            workers,
+        ]
+    )
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert results == EXPECTED + EXPECTED
+
+
+def test_rank_bad_workers() -> None:
+    with pytest.raises(SystemExit):
+        main(["rank", "--workers", "0"])
+
+
+def test_table(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(table, "build", lambda: array("H", [1, 7462]))
+    output = tmp_path / "hands.tbl"
+
+    main(["table", "--output", str(output)])
+
+    assert output.read_bytes()[:4] == b"PKRT"
+    assert output.read_bytes()[-4:] == array("H", [1, 7462]).tobytes()
+    assert not (tmp_path / "hands.tbl.tmp").exists()
+
+
+def test_serve(monkeypatch: pytest.MonkeyPatch) -> None:
+    def run(app: str, host: str, port: int, workers: int) -> None:
+        assert (app, host, port, workers) == ("poker.api:app", "0.0.0.0", 8001, 3)
+        tables = SharedTables(os.environ[shared.ENVIRONMENT])
+        assert dict(tables.products) == dict(lookup.tables()[2])
+
+    monkeypatch.setattr(uvicorn, "run", run)
+    # Serving sets the variable directly, so set it here for it to be restored
+    monkeypatch.setenv(shared.ENVIRONMENT, "")
+
+    main(["serve", "--host", "0.0.0.0", "--port", "8001", "--workers", "3"])
+
+    assert not os.path.exists(os.environ[shared.ENVIRONMENT])
+
+
+def test_verify() -> None:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        main(
+            [
+                "verify",
+                "batch",
+                "--hands",
+                "300",
+                "--chunk-size",
+                "100",
+                "--workers",
+                "1",
+            ]
+        )
+
+    assert output.getvalue().startswith("batch: 300 hands, 0 mismatches, ")
+
+
+def test_simulate() -> None:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        main(["simulate", "--deals", "1000", "--cards", "7", "--dead", "AH KD"])
+
+    report = json.loads(output.getvalue())
+    assert report["hands"] == 1000
+    assert sum(report["frequencies"].values()) == 1000
+
+
+def test_simulate_not_enough_cards() -> None:
+    with pytest.raises(SystemExit):
+        main(["simulate", "--players", "8", "--cards", "7"])
+
+
+def test_verify_unknown_engine() -> None:
+    with pytest.raises(SystemExit):
+        main(["verify", "fast"])
@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from poker import equity
+from poker.parser import parse_cards
+
+
+def test_calculate_exact() -> None:
+    result = equity.calculate(
+        [parse_cards("AH AC"), parse_cards("KD KS")], parse_cards("2C 7D 9H")
+    )
+
+    assert result.exact
+    assert result.trials == 990
+    assert result.seed is None
+    assert result.players[0].win == pytest.approx(907 / 990)
+    assert result.players[1].win == pytest.approx(83 / 990)
+    assert all(player.interval is None for player in result.players)
+
+
+def test_calculate_exact_tie() -> None:
+    result = equity.calculate(
+        [parse_cards("2H 3C"), parse_cards("2D 3S")], parse_cards("AH KC QD JS 10H")
+    )
+
+    assert result.trials == 1
+    assert [player.tie for player in result.players] == [1.0, 1.0]
+
+
+def test_calculate_sampled() -> None:
+    hands = [parse_cards("AH AC"), parse_cards("KD KS")]
+
+    result = equity.calculate(hands, trials=20_000, seed=1)
+
+    assert not result.exact
+    assert result.seed == 1
+    for player in result.players:
+        assert player.win + player.tie + player.loss == pytest.approx(1)
+        assert player.interval is not None
+        assert player.interval[0] < player.win < player.interval[1]
+    # Pocket aces win about 81% of the time against pocket kings
+    assert result.players[0].interval is not None
+    assert result.players[0].interval[0] < 0.81 < result.players[0].interval[1]
+
+    with ThreadPoolExecutor(2) as executor:
+        assert (
+            equity.calculate(hands, trials=20_000, seed=1, executor=executor) == result
+        )
+
+
+@pytest.mark.parametrize(
+    "hands,board,dead",
+    [
+        (["AH AC"], "", ""),
+        (["AH AC KD", "KS KC"], "", ""),
+        (["AH AC", "KS KC"], "2C 3C 4C 5C 6C 7C", ""),
+        (["AH AC", "AH KC"], "", ""),
+        (["AH AC", "KS KC"], "", "AH"),
+    ],
+    ids=[
+        "one-hand",
+        "three-hole-cards",
+        "six-board-cards",
+        "repeated-in-hands",
+        "repeated-in-dead",
+    ],
+)
+def test_calculate_bad_input(hands: list[str], board: str, dead: str) -> None:
+    with pytest.raises(ValueError):
+        equity.calculate(
+            [parse_cards(hand) for hand in hands], parse_cards(board), parse_cards(dead)
+        )
@@ -0,0 +1,129 @@
+import fcntl
+import json
+import time
+from pathlib import Path
+
+from poker.constants import JobStatus
+from poker.jobs import Jobs, read
+from poker.models import Job
+
+HANDS = [b"AH KH QH JH 10H\n", b"2C 3D 5H 7S 9C\n", b"\n", b"AH AH\n", b"KC KD KH\n"]
+
+
+def _submit(jobs: Jobs, lines: list[bytes]) -> str:
+    job_id = jobs.new()
+    Path(jobs.input_path(job_id)).write_bytes(b"".join(lines))
+    jobs.submit(job_id, len(lines))
+    return job_id
+
+
+def _wait(jobs: Jobs, job_id: str) -> Job:
+    for _ in range(500):
+        job = jobs.get(job_id)
+        assert job is not None
+        if job.status in (JobStatus.DONE, JobStatus.FAILED):
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(job_id)
+
+
+def _results(jobs: Jobs, job: Job) -> list[dict[str, str]]:
+    return [
+        json.loads(line)
+        for path in jobs.results(job)
+        for line in Path(path).read_text().splitlines()
+    ]
+
+
+def test_job(tmp_path: Path) -> None:
+    jobs = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+    job = _wait(jobs, _submit(jobs, HANDS))
+
+    assert (job.status, job.lines, job.chunks, job.completed_chunks) == (
+        JobStatus.DONE,
+        5,
+        3,
+        3,
+    )
+    assert _results(jobs, job) == [
+        {"description": "royal flush: hearts"},
+        {"description": "high card: 9"},
+        {"error": "Hand contains duplicate card: 'AH'."},
+        {"error": "Hand must have five cards."},
+    ]
+    assert jobs.chunk(job, 2) is not None
+    assert jobs.chunk(job, 3) is None
+    jobs.close()
+
+
+def test_get_unknown_job(tmp_path: Path) -> None:
+    jobs = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+
+    assert jobs.get("0" * 32) is None
+    assert jobs.get("../etc") is None
+
+
+def test_resume(tmp_path: Path) -> None:
+    jobs = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+    job_id = jobs.new()
+    Path(jobs.input_path(job_id)).write_bytes(b"".join(HANDS))
+    # As left by a crash after writing the first chunk
+    job = Job(job_id=job_id, status=JobStatus.RUNNING, lines=5, chunk_size=2, chunks=3)
+    (tmp_path / job_id / "job.json").write_text(job.json())
+    (tmp_path / job_id / "chunks" / "00000000.jsonl").write_text('{"kept": "1"}\n')
+    (tmp_path / job_id / "chunks" / "00000001.jsonl.tmp").write_text("partial")
+
+    jobs.resume()
+    job = _wait(jobs, job_id)
+
+    assert job.status == JobStatus.DONE
+    assert _results(jobs, job)[0] == {"kept": "1"}
+    assert len(_results(jobs, job)) == 3
+
+
+def test_resume_claimed(tmp_path: Path) -> None:
+    jobs = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+    job_id = _submit(jobs, HANDS)
+    _wait(jobs, job_id)
+    job = Job(job_id=job_id, status=JobStatus.QUEUED, lines=5, chunk_size=2, chunks=3)
+    (tmp_path / job_id / "job.json").write_text(job.json())
+    (tmp_path / job_id / "chunks" / "00000000.jsonl").unlink()
+    other = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+
+    # As when another worker process is running the job
+    with open(tmp_path / job_id / "lock", "wb") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        other.resume()
+        other._runner.shutdown(wait=True)
+
+    result = jobs.get(job_id)
+    assert result is not None
+    assert (result.status, result.completed_chunks) == (JobStatus.QUEUED, 2)
+    jobs.close()
+
+
+def test_resume_finished_elsewhere(tmp_path: Path) -> None:
+    jobs = Jobs(str(tmp_path), chunk_size=2, executor=lambda: None)
+    job_id = _submit(jobs, HANDS)
+    _wait(jobs, job_id)
+    (tmp_path / job_id / "chunks" / "00000000.jsonl").unlink()
+
+    # The job was queued here before another process finished it
+    jobs._runner.submit(jobs._run, job_id).result()
+
+    result = jobs.get(job_id)
+    assert result is not None
+    assert (result.status, result.completed_chunks) == (JobStatus.DONE, 2)
+    jobs.close()
+
+
+def test_read(tmp_path: Path) -> None:
+    paths = []
+    for index, data in enumerate([b"abc", b"", b"defg"]):
+        path = tmp_path / str(index)
+        path.write_bytes(data)
+        paths.append(str(path))
+
+    assert b"".join(read(paths, 0, 7)) == b"abcdefg"
+    assert b"".join(read(paths, 2, 5)) == b"cde"
+    assert b"".join(read(paths, 4, 7)) == b"efg"
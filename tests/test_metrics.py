@@ -0,0 +1,88 @@
+import pytest
+
+from poker.metrics import Registry
+
+
+def test_counter() -> None:
+    registry = Registry()
+    counter = registry.counter("requests_total", "Requests.", ("route", "status"))
+
+    counter.inc("/rank", "200")
+    counter.inc("/rank", "200")
+    counter.inc("/rank", "422")
+
+    assert counter.get("/rank", "200") == 2
+    assert registry.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{route="/rank",status="200"} 2\n'
+        'requests_total{route="/rank",status="422"} 1\n'
+    )
+
+
+def test_counter_wrong_labels() -> None:
+    counter = Registry().counter("requests_total", "Requests.", ("route",))
+
+    with pytest.raises(ValueError):
+        counter.inc()
+
+
+def test_callback() -> None:
+    registry = Registry()
+    values = [3]
+    registry.callback("queue_depth", "Queued hands.", "gauge", lambda: values[0])
+
+    values[0] = 5
+
+    assert registry.render() == (
+        "# HELP queue_depth Queued hands.\n"
+        "# TYPE queue_depth gauge\n"
+        "queue_depth 5\n"
+    )
+
+
+def test_histogram() -> None:
+    registry = Registry()
+    histogram = registry.histogram(
+        "stage_seconds", "Stage latency.", ("stage",), buckets=(0.1, 1.0)
+    )
+
+    histogram.observe(0.05, "parse")
+    histogram.observe(0.1, "parse")
+    histogram.observe(0.5, "parse")
+    histogram.observe(2.0, "parse")
+
+    assert histogram.count("parse") == 4
+    assert registry.render() == (
+        "# HELP stage_seconds Stage latency.\n"
+        "# TYPE stage_seconds histogram\n"
+        'stage_seconds_bucket{stage="parse",le="0.1"} 2\n'
+        'stage_seconds_bucket{stage="parse",le="1.0"} 3\n'
+        'stage_seconds_bucket{stage="parse",le="+Inf"} 4\n'
+        'stage_seconds_sum{stage="parse"} 2.65\n'
+        'stage_seconds_count{stage="parse"} 4\n'
+    )
+
+
+def test_histogram_time() -> None:
+    histogram = Registry().histogram("stage_seconds", "Stage latency.")
+
+    with histogram.time():
+        pass
+
+    assert histogram.count() == 1
+
+
+def test_duplicate_name() -> None:
+    registry = Registry()
+    registry.counter("requests_total", "Requests.")
+
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests.")
+
+
+def test_escape_label_values() -> None:
+    registry = Registry()
+    registry.counter("hands_total", "Hands.", ("hand",)).inc('say "hi"\n')
+
+    assert 'hands_total{hand="say \\"hi\\"\\n"} 1' in registry.render()
@@ -0,0 +1,72 @@
+from itertools import combinations
+
+import pytest
+
+from poker.constants import Rank
+from poker.outs import calculate
+from poker.parser import parse_cards
+from poker.rank import lookup
+from poker.rank.cards import DECK
+
+
+def test_flush_and_straight_draw() -> None:
+    result = calculate(parse_cards("AH KH 7H 2H QC JD"), dead=parse_cards("3H"))
+
+    assert (result.rank, result.description) == (Rank.HIGH_CARD, "high card: ace")
+    assert len(result.cards) == 45
+    assert [(outs.rank, outs.outs) for outs in result.ranks] == [
+        (Rank.FLUSH, 8),
+        (Rank.STRAIGHT, 3),
+        (Rank.PAIR, 16),
+    ]
+    assert result.outs == 27
+    assert result.probability == pytest.approx(27 / 45)
+    assert result.ranks[0].probability == pytest.approx(8 / 45)
+    ten = next(card for card in result.cards if card.card == "10H")
+    assert (ten.rank, ten.description, ten.improves) == (
+        Rank.FLUSH,
+        "flush: hearts",
+        True,
+    )
+
+
+def test_four_cards_match_five_card_evaluator() -> None:
+    cards = parse_cards("9S 9D 4C 4H")
+    result = calculate(cards)
+
+    assert result.rank == Rank.TWO_PAIR
+    assert result.outs == 4
+    assert [(outs.rank, outs.outs) for outs in result.ranks] == [(Rank.FULL_HOUSE, 4)]
+    unseen = [card for card in DECK if card not in cards]
+    for card, next_card in zip(unseen, result.cards):
+        index = lookup.evaluate([*cards, card])
+        assert next_card.rank == lookup.CLASSES[index].rank
+
+
+def test_six_cards_match_seven_card_evaluator() -> None:
+    cards = DECK[:3] + DECK[20:23]
+    result = calculate(cards)
+
+    unseen = [card for card in DECK if card not in cards]
+    for card, next_card in zip(unseen, result.cards):
+        best = min(lookup.evaluate(five) for five in combinations([*cards, card], 5))
+        assert next_card.rank == lookup.CLASSES[best].rank
+
+
+@pytest.mark.parametrize(
+    "cards, dead, message",
+    [
+        ("AH KH QH", "", "Hand must have four or six cards."),
+        ("AH KH QH JH 10H", "", "Hand must have four or six cards."),
+        ("AH KH QH JH", "AH", "Cards must not be repeated."),
+    ],
+)
+def test_invalid_cards(cards: str, dead: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        calculate(parse_cards(cards), parse_cards(dead))
+
+
+def test_no_cards_left() -> None:
+    cards = DECK[:4]
+    with pytest.raises(ValueError, match="No cards left to deal."):
+        calculate(cards, DECK[4:])
@@ -0,0 +1,108 @@
+import pytest
+
+from poker.constants import Suit, Value
+from poker.parser import CARDS, format_card, parse_cards, parse_hand, read_hand
+from poker.rank.cards import encode
+
+
+def test_parse_hand() -> None:
+    assert parse_hand("2H 3D 5S 10C KD") == [
+        encode(Suit.HEARTS, Value.TWO),
+        encode(Suit.DIAMONDS, Value.THREE),
+        encode(Suit.SPADES, Value.FIVE),
+        encode(Suit.CLUBS, Value.TEN),
+        encode(Suit.DIAMONDS, Value.KING),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text,message",
+    [
+        ("AH KH QH JH", "five cards"),
+        ("AH KH QH JH 99W", "'99W'"),
+        ("AH KH QH JH AH", "duplicate"),
+    ],
+    ids=[
+        "too-few",
+        "not-a-card",
+        "duplicate",
+    ],
+)
+def test_parse_hand_bad_input(text: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_hand(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2h 3d 5s 10c kd",
+        "2H 3D 5S TC KD",
+        "2♥ 3♦ 5♠ T♣ K♦",
+        "2♡ 3♢ 5♤ t♧ k♢",
+        "2h 3D 5♠ tc Kd",
+    ],
+    ids=[
+        "lower-case",
+        "ten-as-t",
+        "glyphs",
+        "hollow-glyphs",
+        "mixed",
+    ],
+)
+def test_parse_hand_alternative_notation(text: str) -> None:
+    assert parse_hand(text) == parse_hand("2H 3D 5S 10C KD")
+
+
+@pytest.mark.parametrize(
+    "text,message",
+    [
+        ("AH KH QH JH 1H", "Invalid card: '1H'."),
+        ("AH KH QH JH 10", "Invalid card: '10'."),
+        ("AH KH QH JH TT", "Invalid card: 'TT'."),
+        ("AH KH QH JH A♥", "duplicate card: 'A♥'."),
+        ("th KH QH JH 10H", "duplicate card: '10H'."),
+    ],
+)
+def test_parse_hand_names_bad_card(text: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_hand(text)
+
+
+def test_format_card() -> None:
+    for token, card in CARDS.items():
+        assert format_card(card) == token
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "2H 3D 5S 10C KD\n",
+        '"2H 3D 5S 10C KD"',
+        '{"hand": "2H 3D 5S 10C KD", "table": 7}',
+    ],
+    ids=[
+        "text",
+        "json-string",
+        "json-object",
+    ],
+)
+def test_read_hand(line: str) -> None:
+    assert read_hand(line) == "2H 3D 5S 10C KD"
+
+
+@pytest.mark.parametrize("line", ['{"cards": "2H"}', '"2H 3D', "[1, 2]"])
+def test_read_hand_bad_input(line: str) -> None:
+    with pytest.raises(ValueError):
+        read_hand(line)
+
+
+def test_parse_cards() -> None:
+    assert parse_cards("") == []
+    assert parse_cards("2H 3D") == [
+        encode(Suit.HEARTS, Value.TWO),
+        encode(Suit.DIAMONDS, Value.THREE),
+    ]
+
+    with pytest.raises(ValueError, match="duplicate"):
+        parse_cards("2H 2H")
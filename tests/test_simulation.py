@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from poker.constants import Rank
+from poker.rank.cards import DECK
+from poker.simulation import deal, simulate
+
+
+def test_deal() -> None:
+    hands = deal(np.random.default_rng(0), 1000, players=3, cards=7)
+
+    assert hands.shape == (1000, 3, 7)
+    assert set(hands.flatten().tolist()) <= set(DECK)
+    for cards in hands.reshape(1000, -1).tolist():
+        assert len(set(cards)) == 21
+
+
+def test_deal_dead() -> None:
+    dead = DECK[:40]
+
+    hands = deal(np.random.default_rng(0), 100, players=2, cards=6, dead=dead)
+
+    assert np.all(np.sort(hands.reshape(100, -1)) == np.sort(DECK[40:]))
+
+
+def test_deal_not_enough_cards() -> None:
+    with pytest.raises(ValueError, match="Not enough cards"):
+        deal(np.random.default_rng(0), 1, players=11, cards=5)
+
+
+def test_simulate() -> None:
+    result = simulate(20000, players=2, cards=7, seed=1)
+
+    assert result.seed == 1
+    assert result.hands == 40000
+    assert list(result.frequencies) == list(Rank)
+    assert sum(result.frequencies.values()) == 40000
+    # Roughly 23.5% of seven card hands are two pair
+    assert 8500 < result.frequencies[Rank.TWO_PAIR] < 10300
+
+
+def test_simulate_reproducible() -> None:
+    assert simulate(1000, seed=3) == simulate(1000, seed=3)
+    assert simulate(1000, seed=3) != simulate(1000, seed=4)
+
+
+def test_simulate_random_seed() -> None:
+    result = simulate(10)
+
+    assert simulate(10, seed=result.seed) == result
+
+
+@pytest.mark.parametrize("cards", [4, 8])
+def test_simulate_bad_cards(cards: int) -> None:
+    with pytest.raises(ValueError, match="five to 7 cards"):
+        simulate(10, cards=cards)